@@ -1,7 +1,10 @@
 import time
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from dummy_sensor import DummySensor
+from sensor_history import SensorHistory
+
+AVERAGE_WINDOW_SECONDS = 5 * 60  # 평균을 계산할 구간 (5분)
 
 
 class MissionComputer:
@@ -15,7 +18,9 @@ class MissionComputer:
             'mars_base_internal_oxygen': 0.0
         }
         self.ds = DummySensor()
-        self.log_history = []
+        # 고정 크기 링 버퍼에 센서 기록 저장 (메모리 사용량 일정, 5분 평균은 누적 합계로 O(1) 계산)
+        self.log_history = SensorHistory(self.env_values.keys())
+        self.log_history.add_window(AVERAGE_WINDOW_SECONDS)
 
     def get_sensor_data(self):
         start_time = datetime.now()
@@ -28,15 +33,15 @@ class MissionComputer:
 
             # 센서 데이터 수집
             self.ds.set_env()
-            new_data = self.ds.get_env()
-            self.env_values = new_data
+            sample = self.ds.get_sample()  # 측정마다 새로 만들어지는 불변 샘플
+            self.env_values = sample.as_dict()
 
             # JSON 출력
             print(json.dumps(self.env_values, indent=4))
 
             # 로그 기록
             timestamp = datetime.now()
-            self.log_history.append((timestamp, new_data))
+            self.record_sample(sample)
 
             # 5분 평균 출력
             if (timestamp - start_time).seconds >= 60:
@@ -45,6 +50,10 @@ class MissionComputer:
 
             time.sleep(5)
 
+    def record_sample(self, sample):
+        # 샘플의 값을 링 버퍼에 복사해서 저장
+        self.log_history.append(sample.timestamp, sample)
+
     def check_for_exit(self):
         import msvcrt
         if msvcrt.kbhit():
@@ -54,25 +63,12 @@ class MissionComputer:
         return False
 
     def print_5min_average(self):
-        now = datetime.now()
-        five_minutes_ago = now - timedelta(minutes=5)
-
-        recent_data = [
-            data for ts, data in self.log_history
-            if five_minutes_ago <= ts <= now
-        ]
+        average_data = self.log_history.average(AVERAGE_WINDOW_SECONDS)
 
-        if not recent_data:
+        if average_data is None:
             print('No data available for 5-minute average.')
             return
 
-        average_data = {}
-        keys = self.env_values.keys()
-
-        for key in keys:
-            values = [d[key] for d in recent_data]
-            average_data[key] = sum(values) / len(values)
-
         print('---- 5 Minute Average ----')
         print(json.dumps(average_data, indent=4))
 
@@ -0,0 +1,116 @@
+import time
+from array import array
+
+# 기본 용량: 5초 간격으로 24시간 분량
+DEFAULT_CAPACITY = 24 * 60 * 60 // 5
+
+
+class _Window:
+    """하나의 시간 구간(초)에 대한 누적 합계 상태"""
+
+    def __init__(self, seconds, key_count, start):
+        self.seconds = seconds
+        self.start = start  # 구간에 포함된 가장 오래된 샘플의 순번
+        self.count = 0
+        self.sums = [0.0] * key_count
+
+
+class SensorHistory:
+    """센서 기록을 고정 크기 배열에 저장하는 링 버퍼
+
+    센서 항목마다 float 배열 하나와 타임스탬프 배열을 두어 메모리 사용량이 일정하다.
+    등록된 시간 구간마다 누적 합계를 유지하므로 샘플 하나를 추가할 때 O(1)(분할 상환)이고,
+    평균 조회도 O(1)이다.
+    """
+
+    def __init__(self, keys, capacity=DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError('capacity는 1 이상이어야 합니다.')
+        self.keys = tuple(keys)
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._columns = [array('d', bytes(8 * capacity)) for _ in self.keys]
+        self._next = 0  # 다음에 기록할 샘플의 순번 (0부터 계속 증가)
+        self._windows = {}
+
+    def __len__(self):
+        return min(self._next, self.capacity)
+
+    def _oldest(self):
+        return max(0, self._next - self.capacity)
+
+    def add_window(self, seconds):
+        """평균을 O(1)로 조회할 시간 구간을 등록 (등록 시에만 현재 버퍼를 한 번 훑음)"""
+        if seconds in self._windows:
+            return
+        window = _Window(seconds, len(self.keys), self._oldest())
+        for seq in range(self._oldest(), self._next):
+            self._add(window, seq)
+        if self._next:
+            self._evict_before(window, self._timestamps[(self._next - 1) % self.capacity] - seconds)
+        self._windows[seconds] = window
+
+    def _add(self, window, seq):
+        slot = seq % self.capacity
+        sums = window.sums
+        for i, column in enumerate(self._columns):
+            sums[i] += column[slot]
+        window.count += 1
+
+    def _remove_oldest(self, window):
+        slot = window.start % self.capacity
+        sums = window.sums
+        for i, column in enumerate(self._columns):
+            sums[i] -= column[slot]
+        window.start += 1
+        window.count -= 1
+        if window.count == 0:
+            window.sums = [0.0] * len(self.keys)  # 비었을 때 누적 오차 초기화
+
+    def _evict_before(self, window, cutoff):
+        # cutoff보다 오래된 샘플을 구간에서 제외
+        while window.count and self._timestamps[window.start % self.capacity] < cutoff:
+            self._remove_oldest(window)
+
+    def append(self, timestamp, values):
+        """샘플 하나를 기록 (timestamp: 초 단위 float, values: 센서 항목별 값 딕셔너리)"""
+        seq = self._next
+        slot = seq % self.capacity
+
+        # 덮어쓸 칸에 있던 샘플은 먼저 모든 구간에서 제외
+        if seq >= self.capacity:
+            for window in self._windows.values():
+                if window.count and window.start <= seq - self.capacity:
+                    self._remove_oldest(window)
+
+        self._timestamps[slot] = timestamp
+        for column, key in zip(self._columns, self.keys):
+            column[slot] = values[key]
+        self._next += 1
+
+        for window in self._windows.values():
+            if window.count == 0:
+                window.start = seq
+            self._add(window, seq)
+            self._evict_before(window, timestamp - window.seconds)
+
+    def average(self, seconds, now=None):
+        """최근 seconds초 동안의 항목별 평균 (샘플이 없으면 None)
+
+        now를 주지 않으면 현재 시각을 기준으로 한다. 처음 조회하는 구간은 자동으로 등록된다.
+        """
+        if seconds not in self._windows:
+            self.add_window(seconds)
+        window = self._windows[seconds]
+
+        self._evict_before(window, (time.time() if now is None else now) - seconds)
+        if window.count == 0:
+            return None
+        return {key: total / window.count for key, total in zip(self.keys, window.sums)}
+
+    def latest(self):
+        """가장 최근 샘플을 (타임스탬프, 값 딕셔너리)로 반환 (없으면 None)"""
+        if not self._next:
+            return None
+        slot = (self._next - 1) % self.capacity
+        return self._timestamps[slot], {key: column[slot] for key, column in zip(self.keys, self._columns)}
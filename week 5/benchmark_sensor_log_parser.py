@@ -0,0 +1,100 @@
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+from sensor_log_parser import (
+    _TimestampParser, average_between, convert_log_to_binary,
+    iter_parsed_log, load_binary_columns, read_log_columns
+)
+from sensor_log_sink import TEXT_FIELDS, TextLogSink
+from sensor_sample import SENSOR_KEYS
+
+LINE_COUNT = 10000000  # 기본 로그 줄 수 (명령행 인자로 변경 가능)
+
+
+def make_log(file_path, line_count, seed=0):
+    """DummySensor와 같은 형식의 5초 간격 로그 파일 생성"""
+    rng = random.Random(seed)
+    start = time.time() - line_count * 5
+    with TextLogSink(file_path, flush_interval=float('inf')) as sink:
+        for i in range(line_count):
+            sink.write(start + i * 5, {key: rng.uniform(0.0, 700.0) for key in SENSOR_KEYS})
+    return start
+
+
+def parse_adhoc(file_path):
+    """비교용: 항목마다 정규식으로 검색하고 strptime으로 시간을 읽는 방식"""
+    count = 0
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            time.mktime(time.strptime(line[:19], '%Y-%m-%d %H:%M:%S'))
+            for _, label, _, _ in TEXT_FIELDS:
+                float(re.search(rf'{label}: ([-0-9.]+)', line).group(1))
+            count += 1
+    return count
+
+
+def parse_split(file_path):
+    """비교용: ', '로 자른 뒤 항목마다 이름/단위를 확인하고 숫자만 잘라내는 방식"""
+    parse_timestamp = _TimestampParser()
+    parts_table = tuple((f'{label}: ', f' {unit}') for _, label, _, unit in TEXT_FIELDS)
+    count = 0
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            parts = line.rstrip('\r\n').split(', ')
+            parse_timestamp(parts[0])
+            for part, (prefix, suffix) in zip(parts[1:], parts_table):
+                if part.startswith(prefix) and part.endswith(suffix):
+                    float(part[len(prefix):-len(suffix)])
+            count += 1
+    return count
+
+
+def parse_regex(file_path):
+    return sum(1 for _ in iter_parsed_log(file_path))
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else LINE_COUNT
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        text_path = os.path.join(temp_dir, 'sensor_log.txt')
+        binary_path = os.path.join(temp_dir, 'sensor_log.bin')
+        start = make_log(text_path, line_count)
+        text_size = os.path.getsize(text_path)
+
+        print(f'센서 로그 {line_count}줄 ({text_size / 1024 / 1024:.1f} MB) 분석 시간 비교')
+        for label, func in (
+            ('항목별 정규식 + strptime', parse_adhoc),
+            ('split + 문자열 자르기', parse_split),
+            ('컴파일된 정규식 한 개', parse_regex)
+        ):
+            seconds, count = measure(func, text_path)
+            assert count == line_count
+            print(f'{label:<24}: {seconds:8.3f}s ({line_count / seconds:12,.0f} 줄/초)')
+
+        seconds, _ = measure(read_log_columns, text_path)
+        print(f'{"텍스트 -> 열 배열":<24}: {seconds:8.3f}s')
+        seconds, _ = measure(convert_log_to_binary, text_path, binary_path)
+        print(f'{"텍스트 -> 이진 변환":<24}: {seconds:8.3f}s '
+              f'({os.path.getsize(binary_path) / 1024 / 1024:.1f} MB)')
+        seconds, columns = measure(load_binary_columns, binary_path)
+        print(f'{"이진 파일 -> 열 배열":<24}: {seconds:8.3f}s')
+
+        # 가운데 하루 구간의 평균
+        middle = start + line_count * 5 / 2
+        seconds, result = measure(average_between, columns, middle, middle + 24 * 60 * 60)
+        print(f'{"하루 구간 평균 조회":<24}: {seconds * 1000:8.3f}ms ({result["count"] if result else 0}개 샘플)')
+
+
+if __name__ == '__main__':
+    main()
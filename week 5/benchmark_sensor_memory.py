@@ -0,0 +1,66 @@
+import random
+import sys
+import tracemalloc
+from datetime import datetime
+
+from sensor_history import SensorHistory
+from sensor_sample import SENSOR_KEYS, SensorSample
+
+SAMPLE_COUNT = 1000000  # 기본 샘플 수 (명령행 인자로 변경 가능)
+
+
+def random_values(rng):
+    return [rng.uniform(0.0, 700.0) for _ in SENSOR_KEYS]
+
+
+def build_dict_history(count, rng):
+    """기존 방식: (datetime, 딕셔너리) 튜플 리스트 (매번 새 딕셔너리를 만든 경우)"""
+    return [(datetime.fromtimestamp(i * 5.0), dict(zip(SENSOR_KEYS, random_values(rng)))) for i in range(count)]
+
+
+def build_sample_history(count, rng):
+    """SensorSample 객체 리스트"""
+    return [SensorSample(i * 5.0, *random_values(rng)) for i in range(count)]
+
+
+def build_packed_history(count, rng):
+    """SensorSample.pack()으로 만든 56바이트 레코드를 이어 붙인 bytearray"""
+    packed = bytearray()
+    for i in range(count):
+        packed += SensorSample(i * 5.0, *random_values(rng)).pack()
+    return packed
+
+
+def build_ring_history(count, rng):
+    """SensorHistory 링 버퍼 (열마다 array('d'))"""
+    history = SensorHistory(SENSOR_KEYS, capacity=count)
+    for i in range(count):
+        history.append(i * 5.0, SensorSample(i * 5.0, *random_values(rng)))
+    return history
+
+
+def measure(builder, count):
+    rng = random.Random(0)
+    tracemalloc.start()
+    result = builder(count, rng)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else SAMPLE_COUNT
+    print(f'센서 샘플 {count}개 저장 시 메모리 사용량')
+    for label, builder in (
+        ('(datetime, dict) 튜플', build_dict_history),
+        ('SensorSample 객체', build_sample_history),
+        ('압축 바이트 (pack)', build_packed_history),
+        ('SensorHistory 링 버퍼', build_ring_history)
+    ):
+        used = measure(builder, count)
+        print(f'{label:<24}: {used / 1024 / 1024:8.1f} MB ({used / count:6.1f} 바이트/샘플)')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,36 @@
 import random  # 랜덤 숫자를 생성 라이브러리
-import datetime  # 시간과 날짜 라이브러리
+import time
 
+try:
+    import numpy as np  # 대량 측정값 생성(generate_batch)에만 사용
+except ImportError:
+    np = None
+
+from sensor_log_sink import TextLogSink
+from sensor_retention import RAW_RETENTION_SECONDS
+from sensor_sample import SENSOR_KEYS, SensorSample
+
+LOG_FILE = 'sensor_log.txt'
+# 원본 로그도 보관 기간(sensor_retention의 원본 단계와 같은 하루)이 지나면 sensor_log.txt.1로 교체
+LOG_ROTATE_SECONDS = RAW_RETENTION_SECONDS
+
+# 센서 항목별 측정 범위 (최솟값, 최댓값)
+SENSOR_RANGES = {
+    'mars_base_internal_temperature': (18.0, 30.0),
+    'mars_base_external_temperature': (0.0, 21.0),
+    'mars_base_internal_humidity': (50.0, 60.0),
+    'mars_base_external_illuminance': (500.0, 715.0),
+    'mars_base_internal_co2': (0.02, 0.1),
+    'mars_base_internal_oxygen': (4.0, 7.0)
+}
 
 # DummySensor 클래스 - 테스트용 센서 클래스
 class DummySensor:
-    def __init__(self):
+    def __init__(self, log_sink=None, verbose=True):
+        # 로그 기록 방식 (기본: 기존과 같은 형식의 sensor_log.txt, CsvLogSink/BinaryLogSink로 교체 가능)
+        self.log_sink = TextLogSink(LOG_FILE, rotate_seconds=LOG_ROTATE_SECONDS) if log_sink is None else log_sink
+        self.verbose = verbose
+        self.last_timestamp = None
         # 센서 값을 저장 딕셔너리
         self.env_values = {
             'mars_base_internal_temperature': 0.0,      
@@ -17,34 +43,72 @@ class DummySensor:
 
     def set_env(self):
         # 각 센서 값을 지정된 범위 내에서 랜덤하게 설정
-        self.env_values['mars_base_internal_temperature'] = random.uniform(18.0, 30.0)
-        self.env_values['mars_base_external_temperature'] = random.uniform(0.0, 21.0)
-        self.env_values['mars_base_internal_humidity'] = random.uniform(50.0, 60.0)
-        self.env_values['mars_base_external_illuminance'] = random.uniform(500.0, 715.0)
-        self.env_values['mars_base_internal_co2'] = random.uniform(0.02, 0.1)
-        self.env_values['mars_base_internal_oxygen'] = random.uniform(4.0, 7.0)
-
-    def get_env(self):
-        # 날짜와 시간을 문자열로 저장
-        timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-        # 로그 한 줄을 문자열로 작성 (센서 정보 + 시간)
-        log_entry = (
-            f'{timestamp}, '
-            f'Internal Temp: {self.env_values["mars_base_internal_temperature"]:.2f} C, '
-            f'External Temp: {self.env_values["mars_base_external_temperature"]:.2f} C, '
-            f'Internal Humidity: {self.env_values["mars_base_internal_humidity"]:.2f} %, '
-            f'External Illuminance: {self.env_values["mars_base_external_illuminance"]:.2f} W/m2, '
-            f'Internal CO2: {self.env_values["mars_base_internal_co2"]:.4f} %, '
-            f'Internal O2: {self.env_values["mars_base_internal_oxygen"]:.2f} %\n'
-        )
-
-        with open('sensor_log.txt', 'a') as file:
-            file.write(log_entry)
-
-        print('로그 생성 완료')
-
-        return self.env_values
+        for key, (low, high) in SENSOR_RANGES.items():
+            self.env_values[key] = random.uniform(low, high)
+
+    @staticmethod
+    def generate_batch(count, seed=None, start_time=0.0, interval=5.0,
+                       drift=0.0, noise=0.0, anomaly_rate=0.0, anomaly_scale=3.0):
+        """측정값 count개를 NumPy 배열로 한 번에 생성 (부하 테스트/재생용)
+
+        반환값은 'timestamp', 센서 항목별 값, 'anomaly'(이상값을 넣은 위치) 배열을 담은 딕셔너리이다.
+        값의 크기는 모두 항목별 범위 폭(최댓값 - 최솟값)에 대한 비율로 지정한다.
+        - drift: 하루(86400초)에 이동하는 평균값의 비율
+        - noise: 정규분포 잡음의 표준편차 비율
+        - anomaly_rate: 측정 하나에 이상값이 들어갈 확률, anomaly_scale: 이상값의 크기(±) 비율
+        같은 seed로 만들면 항상 같은 결과가 나온다.
+        """
+        if np is None:
+            raise RuntimeError('generate_batch()를 사용하려면 NumPy가 필요합니다.')
+        rng = np.random.default_rng(seed)
+        timestamps = start_time + interval * np.arange(count, dtype=np.float64)
+        days = (timestamps - start_time) / 86400.0
+        anomaly = rng.random((count, len(SENSOR_RANGES))) < anomaly_rate if anomaly_rate else None
+
+        batch = {'timestamp': timestamps}
+        for i, (key, (low, high)) in enumerate(SENSOR_RANGES.items()):
+            width = high - low
+            values = rng.uniform(low, high, count)
+            if drift:
+                values += drift * width * days
+            if noise:
+                values += rng.normal(0.0, noise * width, count)
+            if anomaly is not None:
+                signs = rng.choice((-1.0, 1.0), count)
+                values += np.where(anomaly[:, i], signs * anomaly_scale * width, 0.0)
+            batch[key] = values
+        batch['anomaly'] = anomaly.any(axis=1) if anomaly is not None else np.zeros(count, dtype=bool)
+        return batch
+
+    @staticmethod
+    def iter_batch_samples(batch):
+        """generate_batch() 결과를 SensorSample로 하나씩 꺼내는 제너레이터"""
+        columns = [batch['timestamp'].tolist()] + [batch[key].tolist() for key in SENSOR_KEYS]
+        for values in zip(*columns):
+            yield SensorSample(*values)
+
+    def get_env(self, timestamp=None):
+        # 측정 시각 (초 단위, 로그와 샘플에 같은 값을 사용)
+        timestamp = time.time() if timestamp is None else timestamp
+        self.last_timestamp = timestamp
+
+        # 파일을 매번 열고 닫지 않고 로그 싱크의 버퍼에 추가 (크기/시간 기준으로 한 번에 기록)
+        self.log_sink.write(timestamp, self.env_values)
+
+        if self.verbose:
+            print('로그 생성 완료')
+
+        # 내부 딕셔너리를 그대로 넘기면 다음 측정 때 값이 바뀌므로 복사본 반환
+        return dict(self.env_values)
+
+    def get_sample(self):
+        # 측정 한 번마다 새 SensorSample을 만들어 반환 (로그 기록은 get_env()와 동일)
+        values = self.get_env()
+        return SensorSample.from_dict(self.last_timestamp, values)
+
+    def close(self):
+        # 버퍼에 남은 로그를 기록하고 파일을 닫음
+        self.log_sink.close()
 
 if __name__ == '__main__':
     ds = DummySensor()       
@@ -1,14 +1,24 @@
+import argparse
+import asyncio
 import time
 import json
-import platform
-import os
-import psutil
-from datetime import datetime, timedelta
+import select
+import sys
+from datetime import datetime
 from dummy_sensor import DummySensor
+from sensor_acquisition import DEFAULT_INTERVAL, SensorSource, run_acquisition
+from sensor_history import SensorHistory
+from sensor_retention import RETENTION_DIR, SensorRetention
+from sensor_stats import SensorStatistics
+from settings_watcher import DEFAULT_CHECK_INTERVAL, SETTINGS_FILE, SettingsWatcher
+from system_metrics import DEFAULT_SAMPLE_INTERVAL, LOAD_METRICS, STATIC_INFO, MetricsSampler, collect_static_info
+
+AVERAGE_WINDOW_SECONDS = 5 * 60  # 평균을 계산할 구간 (5분)
 
 
 class MissionComputer:
-    def __init__(self):
+    def __init__(self, metrics_interval=DEFAULT_SAMPLE_INTERVAL, settings_interval=DEFAULT_CHECK_INTERVAL,
+                 retention_dir=RETENTION_DIR):
         self.env_values = {
             'mars_base_internal_temperature': 0.0,
             'mars_base_external_temperature': 0.0,
@@ -18,27 +28,36 @@ class MissionComputer:
             'mars_base_internal_oxygen': 0.0
         }
         self.ds = DummySensor()
-        self.log_history = []
-        self.settings = self._load_settings()
-
-    def _load_settings(self):
-        settings = {
-            'os': True,
-            'os_version': True,
-            'cpu_type': True,
-            'cpu_cores': True,
-            'memory': True,
-            'cpu_usage': True,
-            'memory_usage': True
-        }
-        try:
-            with open('setting.txt', 'r') as file:
-                for line in file:
-                    key, value = line.strip().split('=')
-                    settings[key.strip()] = value.strip().lower() == 'true'
-        except FileNotFoundError:
-            pass
-        return settings
+        # 고정 크기 링 버퍼에 센서 기록 저장 (메모리 사용량 일정, 5분 평균은 누적 합계로 O(1) 계산)
+        self.log_history = SensorHistory(self.env_values.keys())
+        self.log_history.add_window(AVERAGE_WINDOW_SECONDS)
+        # 1분/5분/1시간/24시간 구간별 최소/최대/표준편차/분위수
+        self.statistics = SensorStatistics(self.env_values.keys())
+        # 장기 보관: 최근 원본 + 1분/1시간 집계 파일 (retention_dir=None이면 저장하지 않음)
+        self.retention = SensorRetention(retention_dir) if retention_dir else None
+        # 설정 파일(setting.txt)이 바뀌면 다시 읽어서 반영 (재시작 불필요)
+        self.settings_watcher = SettingsWatcher(SETTINGS_FILE, settings_interval, self._apply_settings)
+        # OS/CPU/메모리 크기처럼 바뀌지 않는 정보는 켜진 항목만 한 번 조회해서 보관
+        self.static_info = collect_static_info(self._enabled(STATIC_INFO))
+        # CPU/메모리 사용량은 백그라운드 스레드가 주기적으로 측정 (조회 시 기다리지 않음)
+        self.metrics_sampler = MetricsSampler(metrics_interval, self._enabled(LOAD_METRICS)).start()
+        self.settings_watcher.start()
+
+    @property
+    def settings(self):
+        return self.settings_watcher.settings
+
+    def _enabled(self, keys, settings=None):
+        settings = self.settings if settings is None else settings
+        return [key for key in keys if settings.get(key)]
+
+    def _apply_settings(self, settings):
+        # 새로 켜진 정보 항목만 추가로 조회하고, 꺼진 부하 항목은 측정을 멈춤
+        missing = [key for key in self._enabled(STATIC_INFO, settings) if key not in self.static_info]
+        if missing:
+            self.static_info = {**self.static_info, **collect_static_info(missing)}
+        self.metrics_sampler.set_metrics(self._enabled(LOAD_METRICS, settings))
+        print('[설정] 설정 파일 변경 내용을 반영했습니다.')
 
     def get_sensor_data(self):
         start_time = datetime.now()
@@ -47,16 +66,17 @@ class MissionComputer:
         while True:
             if self.check_for_exit():
                 print('System stopped…')
+                self.shutdown()
                 break
 
             self.ds.set_env()
-            new_data = self.ds.get_env()
-            self.env_values = new_data
+            sample = self.ds.get_sample()  # 측정마다 새로 만들어지는 불변 샘플
+            self.env_values = sample.as_dict()
 
             print(json.dumps(self.env_values, indent=4))
 
             timestamp = datetime.now()
-            self.log_history.append((timestamp, new_data))
+            self.record_sample(sample)
 
             if (timestamp - start_time).seconds >= 60:
                 self.print_5min_average()
@@ -64,8 +84,66 @@ class MissionComputer:
 
             time.sleep(5)
 
+    def record_sample(self, sample):
+        # 샘플의 값을 링 버퍼에 복사해서 저장
+        self.log_history.append(sample.timestamp, sample)
+        self.statistics.add(sample.timestamp, sample)
+        if self.retention is not None:
+            self.retention.add(sample)
+
+    def get_sensor_history(self, start, end, resolution=0):
+        """장기 보관 기록 조회 (start/end: 초 단위 타임스탬프, resolution: 원하는 구간 길이(초), 0이면 원본)"""
+        if self.retention is None:
+            return []
+        return self.retention.query(start, end, resolution)
+
+    def get_sensor_data_async(self, sensor_count=1, interval=DEFAULT_INTERVAL, duration=None, sources=None):
+        """센서마다 asyncio 태스크로 측정하는 수집 모드 (Linux 지원, 'q'/Ctrl+C/SIGTERM으로 종료)
+
+        sources를 주지 않으면 DummySensor sensor_count개를 만들어 같은 로그 파일에 기록한다.
+        """
+        if sources is None:
+            sources = [SensorSource.from_dummy_sensor('sensor_1', self.ds, interval)]
+            for number in range(2, sensor_count + 1):
+                sensor = DummySensor(log_sink=self.ds.log_sink, verbose=self.ds.verbose)
+                sources.append(SensorSource.from_dummy_sensor(f'sensor_{number}', sensor, interval))
+
+        print('Mission Computer started (async). Press "q" or Ctrl+C to stop.')
+        self._last_average_time = time.monotonic()
+        asyncio.run(run_acquisition(sources, self._on_async_sample, duration))
+        self.shutdown()
+        print('System stopped…')
+
+    def _on_async_sample(self, name, sample):
+        # 모든 센서 태스크의 샘플이 대기열을 거쳐 이 함수 하나에서 순서대로 처리됨
+        self.env_values = sample.as_dict()
+        print(f'[{name}]')
+        print(json.dumps(self.env_values, indent=4))
+        self.record_sample(sample)
+
+        now = time.monotonic()
+        if now - self._last_average_time >= 60:
+            self.print_5min_average()
+            self._last_average_time = now
+
+    def shutdown(self):
+        # 버퍼에 남은 센서 로그를 기록하고 부하 측정/설정 확인 스레드 종료
+        self.ds.close()
+        self.metrics_sampler.stop()
+        self.settings_watcher.stop()
+        if self.retention is not None:
+            self.retention.close()
+
     def check_for_exit(self):
-        import msvcrt
+        try:
+            import msvcrt
+        except ImportError:
+            # Windows가 아니면 표준 입력에 들어온 줄을 기다리지 않고 확인 (q 입력 후 Enter)
+            try:
+                readable, _, _ = select.select([sys.stdin], [], [], 0)
+            except (OSError, ValueError):
+                return False
+            return bool(readable) and sys.stdin.readline().strip().lower() == 'q'
         if msvcrt.kbhit():
             key = msvcrt.getch().decode('utf-8').lower()
             if key == 'q':
@@ -73,58 +151,38 @@ class MissionComputer:
         return False
 
     def print_5min_average(self):
-        now = datetime.now()
-        five_minutes_ago = now - timedelta(minutes=5)
-
-        recent_data = [
-            data for ts, data in self.log_history
-            if five_minutes_ago <= ts <= now
-        ]
+        average_data = self.log_history.average(AVERAGE_WINDOW_SECONDS)
 
-        if not recent_data:
+        if average_data is None:
             print('No data available for 5-minute average.')
             return
 
-        average_data = {}
-        keys = self.env_values.keys()
-
-        for key in keys:
-            values = [d[key] for d in recent_data]
-            average_data[key] = sum(values) / len(values)
-
         print('---- 5 Minute Average ----')
         print(json.dumps(average_data, indent=4))
 
+    def print_statistics(self, window='5m'):
+        statistics = self.statistics.summary(window, now=time.time())
+        print(f'---- {window} Statistics ----')
+        print(json.dumps(statistics, indent=4))
+        return statistics
+
     def get_mission_computer_info(self):
-        info = {}
-        try:
-            if self.settings.get('os'):
-                info['os'] = platform.system()
-            if self.settings.get('os_version'):
-                info['os_version'] = platform.version()
-            if self.settings.get('cpu_type'):
-                info['cpu_type'] = platform.processor()
-            if self.settings.get('cpu_cores'):
-                info['cpu_cores'] = os.cpu_count()
-            if self.settings.get('memory'):
-                info['memory'] = str(round(psutil.virtual_memory().total / (1024 ** 3), 2)) + ' GB'
-        except Exception as e:
-            info['error'] = str(e)
+        # 미리 조회해 둔 정보 중 설정에서 켠 항목만 반환
+        static_info = self.static_info
+        info = {key: static_info[key] for key in self._enabled(STATIC_INFO) if key in static_info}
+        if 'error' in self.static_info:
+            info['error'] = self.static_info['error']
 
         print('---- System Info ----')
         print(json.dumps(info, indent=4))
         return info
 
     def get_mission_computer_load(self):
-        load = {}
-        try:
-            if self.settings.get('cpu_usage'):
-                load['cpu_usage'] = str(psutil.cpu_percent(interval=1)) + ' %'
-            if self.settings.get('memory_usage'):
-                memory = psutil.virtual_memory()
-                load['memory_usage'] = str(memory.percent) + ' %'
-        except Exception as e:
-            load['error'] = str(e)
+        # 백그라운드 스레드가 마지막으로 측정한 결과를 바로 반환
+        snapshot = self.metrics_sampler.snapshot
+        load = {key: snapshot[key] for key in LOAD_METRICS if self.settings.get(key) and key in snapshot}
+        if 'error' in snapshot:
+            load['error'] = snapshot['error']
 
         print('---- System Load ----')
         print(json.dumps(load, indent=4))
@@ -132,7 +190,18 @@ class MissionComputer:
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='화성 기지 미션 컴퓨터')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='센서마다 asyncio 태스크로 측정 (Linux 지원)')
+    parser.add_argument('--sensors', type=int, default=1, help='--async 모드의 센서 수')
+    parser.add_argument('--interval', type=float, default=DEFAULT_INTERVAL, help='--async 모드의 측정 간격(초)')
+    parser.add_argument('--duration', type=float, default=None, help='--async 모드를 자동으로 끝낼 시간(초)')
+    args = parser.parse_args()
+
     RunComputer = MissionComputer()
     RunComputer.get_mission_computer_info()
     RunComputer.get_mission_computer_load()
-    RunComputer.get_sensor_data()
+    if args.use_async:
+        RunComputer.get_sensor_data_async(args.sensors, args.interval, args.duration)
+    else:
+        RunComputer.get_sensor_data()
@@ -0,0 +1,77 @@
+import argparse
+import os
+import time
+
+from dummy_sensor import DummySensor
+from mars_mission_computer import MissionComputer
+from sensor_log_sink import BinaryLogSink, CsvLogSink, TextLogSink
+
+# 5초 간격 측정 기준 하루 분량
+SAMPLES_PER_DAY = 24 * 60 * 60 // 5
+
+LOG_SINKS = {'.txt': TextLogSink, '.csv': CsvLogSink, '.bin': BinaryLogSink}
+
+
+def replay(computer, batch, log_sink=None):
+    """generate_batch() 결과를 MissionComputer에 최대한 빠르게 넣고 단계별 소요 시간(초)을 반환"""
+    timings = {}
+
+    start = time.perf_counter()
+    samples = list(DummySensor.iter_batch_samples(batch))
+    timings['SensorSample 변환'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for sample in samples:
+        computer.record_sample(sample)
+    timings['record_sample'] = time.perf_counter() - start
+
+    if log_sink is not None:
+        start = time.perf_counter()
+        with log_sink:
+            for sample in samples:
+                log_sink.write(sample.timestamp, sample)
+        timings[f'로그 기록 ({type(log_sink).__name__})'] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대량의 가상 센서 데이터를 MissionComputer로 재생해 처리량 측정')
+    parser.add_argument('--days', type=float, default=7, help='재생할 기간 (5초 간격 기준 일 수)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--drift', type=float, default=0.0, help='하루당 평균 이동 비율')
+    parser.add_argument('--noise', type=float, default=0.0, help='잡음 표준편차 비율')
+    parser.add_argument('--anomaly-rate', type=float, default=0.0, help='측정당 이상값 확률')
+    parser.add_argument('--log', default=None, help='샘플을 기록할 파일 (.txt/.csv/.bin, 없으면 기록하지 않음)')
+    parser.add_argument('--retention', default=None, help='장기 보관 파일을 저장할 폴더 (없으면 저장하지 않음)')
+    args = parser.parse_args()
+
+    count = int(args.days * SAMPLES_PER_DAY)
+    start = time.perf_counter()
+    batch = DummySensor.generate_batch(
+        count, seed=args.seed, start_time=time.time() - count * 5.0,
+        drift=args.drift, noise=args.noise, anomaly_rate=args.anomaly_rate
+    )
+    generate_time = time.perf_counter() - start
+
+    log_sink = None
+    if args.log:
+        extension = os.path.splitext(args.log)[1].lower()
+        if extension not in LOG_SINKS:
+            parser.error('--log 파일 확장자는 .txt, .csv, .bin 중 하나여야 합니다.')
+        log_sink = LOG_SINKS[extension](args.log)
+
+    computer = MissionComputer(retention_dir=args.retention)
+    timings = {'generate_batch': generate_time}
+    timings.update(replay(computer, batch, log_sink))
+
+    print(f'센서 샘플 {count}개 재생 (이상값 {int(batch["anomaly"].sum())}개)')
+    for label, seconds in timings.items():
+        print(f'{label:<32}: {seconds:8.3f}s ({count / seconds:12,.0f} 샘플/초)')
+    total = sum(timings.values())
+    print(f'{"전체":<32}: {total:8.3f}s ({count / total:12,.0f} 샘플/초)')
+    computer.print_statistics('1h')
+    computer.shutdown()
+
+
+if __name__ == '__main__':
+    main()
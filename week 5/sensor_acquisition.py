@@ -0,0 +1,183 @@
+import asyncio
+import os
+import signal
+import sys
+import threading
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+    tty = None
+
+DEFAULT_INTERVAL = 5.0  # 센서 측정 간격 (초)
+DEFAULT_QUEUE_SIZE = 1000  # 처리 단계가 밀릴 때 센서 태스크가 기다리기 시작하는 대기열 크기
+
+
+class SensorSource:
+    """비동기 수집 루프에서 태스크 하나로 실행되는 센서
+
+    read는 SensorSample을 반환하는 함수이다. 측정에 시간이 걸리는 센서는 blocking=True로 두면
+    스레드 풀에서 읽으므로 다른 센서의 측정 주기에 영향을 주지 않는다.
+    """
+
+    def __init__(self, name, read, interval=DEFAULT_INTERVAL, blocking=False, close=None):
+        if interval <= 0:
+            raise ValueError('interval은 0보다 커야 합니다.')
+        self.name = name
+        self.read = read
+        self.interval = interval
+        self.blocking = blocking
+        self._close = close
+
+    @classmethod
+    def from_dummy_sensor(cls, name, sensor, interval=DEFAULT_INTERVAL):
+        def read():
+            sensor.set_env()
+            return sensor.get_sample()
+        return cls(name, read, interval, close=sensor.close)
+
+    def close(self):
+        if self._close is not None:
+            self._close()
+
+
+async def _run_source(source, queue):
+    # 측정 시간만큼 주기가 밀리지 않도록 다음 측정 시각을 기준으로 대기
+    loop = asyncio.get_running_loop()
+    next_time = loop.time()
+    while True:
+        if source.blocking:
+            sample = await loop.run_in_executor(None, source.read)
+        else:
+            sample = source.read()
+        await queue.put((source.name, sample))
+
+        next_time += source.interval
+        delay = next_time - loop.time()
+        if delay < 0:  # 측정이 주기보다 오래 걸렸으면 밀린 측정은 건너뜀
+            next_time = loop.time()
+            delay = 0
+        await asyncio.sleep(delay)
+
+
+async def _consume(queue, on_sample):
+    while True:
+        name, sample = await queue.get()
+        try:
+            on_sample(name, sample)
+        finally:
+            queue.task_done()
+
+
+def _install_stop_handlers(loop, stop_event):
+    """Ctrl+C/SIGTERM 또는 키보드 'q' 입력 시 stop_event를 설정하고, 정리 함수를 반환"""
+    cleanups = []
+
+    for sig in (signal.SIGINT, getattr(signal, 'SIGTERM', None)):
+        if sig is None:
+            continue
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+            cleanups.append(lambda sig=sig: loop.remove_signal_handler(sig))
+        except (NotImplementedError, RuntimeError):  # Windows 이벤트 루프
+            previous = signal.signal(sig, lambda *_: loop.call_soon_threadsafe(stop_event.set))
+            cleanups.append(lambda sig=sig, previous=previous: signal.signal(sig, previous))
+
+    def on_input(text):
+        if 'q' in text.lower():
+            stop_event.set()
+
+    stdin = sys.stdin
+    if stdin is None or stdin.closed:
+        return cleanups
+    try:
+        fd = stdin.fileno()
+    except (OSError, ValueError):
+        return cleanups
+
+    # 터미널이면 Enter 없이 키 하나로 종료할 수 있게 cbreak 모드로 전환
+    if termios is not None and os.isatty(fd):
+        saved = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        cleanups.append(lambda: termios.tcsetattr(fd, termios.TCSADRAIN, saved))
+
+    def on_readable():
+        data = os.read(fd, 1024)
+        if not data:  # 입력이 끝나면(EOF) 더 이상 감시하지 않음
+            loop.remove_reader(fd)
+            return
+        on_input(data.decode('utf-8', errors='ignore'))
+
+    try:
+        loop.add_reader(fd, on_readable)
+        cleanups.append(lambda: loop.remove_reader(fd))
+    except (NotImplementedError, RuntimeError, OSError):
+        # add_reader를 지원하지 않는 이벤트 루프(Windows)나 파일로 바꾼 입력은 입력 전용 스레드로 대신함
+        def read_lines():
+            for line in stdin:
+                loop.call_soon_threadsafe(on_input, line)
+        threading.Thread(target=read_lines, daemon=True).start()
+    return cleanups
+
+
+async def _drain(queue, consumer, stop_event):
+    """대기열에 남은 샘플을 처리할 때까지 기다림
+
+    on_sample이 예외를 내서 consumer가 끝나면 남은 샘플은 버리고 그 예외를 알린다.
+    처리하는 동안 종료 신호를 한 번 더 받으면 남은 샘플을 버리고 바로 끝낸다.
+    """
+    stop_event.clear()
+    join_task = asyncio.ensure_future(queue.join())
+    stop_task = asyncio.ensure_future(stop_event.wait())
+    try:
+        await asyncio.wait({consumer, join_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        join_task.cancel()
+        stop_task.cancel()
+        if not consumer.done():
+            consumer.cancel()
+        await asyncio.gather(consumer, join_task, stop_task, return_exceptions=True)
+    if not consumer.cancelled() and consumer.exception() is not None:
+        raise consumer.exception()
+
+
+async def run_acquisition(sources, on_sample, duration=None, queue_size=DEFAULT_QUEUE_SIZE,
+                          handle_input=True):
+    """센서마다 태스크를 만들어 측정하고, 공용 대기열의 샘플을 on_sample(name, sample)로 처리
+
+    종료 신호(Ctrl+C, SIGTERM, 'q' 입력)를 받거나 duration초가 지나면 센서 태스크를 취소하고,
+    대기열에 남은 샘플까지 처리한 뒤 센서를 닫는다.
+    """
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    queue = asyncio.Queue(maxsize=queue_size)
+    cleanups = _install_stop_handlers(loop, stop_event) if handle_input else []
+    if duration is not None:
+        timer = loop.call_later(duration, stop_event.set)
+        cleanups.append(timer.cancel)
+
+    consumer = asyncio.create_task(_consume(queue, on_sample))
+    producers = [asyncio.create_task(_run_source(source, queue), name=source.name) for source in sources]
+    try:
+        # 센서 태스크가 예외로 끝나면 그 예외를 그대로 알림
+        stop_task = asyncio.create_task(stop_event.wait())
+        done, _ = await asyncio.wait(producers + [stop_task, consumer], return_when=asyncio.FIRST_COMPLETED)
+        stop_task.cancel()
+        for task in done:
+            if task is not stop_task and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+    finally:
+        try:
+            for task in producers:
+                task.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+            if not consumer.done():
+                await _drain(queue, consumer, stop_event)
+        finally:
+            for cleanup in reversed(cleanups):
+                cleanup()
+            for source in sources:
+                source.close()
+
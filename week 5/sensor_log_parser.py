@@ -0,0 +1,194 @@
+import argparse
+import bisect
+import datetime
+import os
+import re
+from array import array
+
+try:
+    import numpy as np  # 있으면 이진 로그를 한 번에 열 배열로 읽음
+except ImportError:
+    np = None
+
+from sensor_log_sink import TEXT_FIELDS, iter_binary_log
+from sensor_sample import SENSOR_KEYS, SensorSample
+
+# 변환된 이진 로그를 모아서 쓰는 크기 (바이트)
+WRITE_CHUNK_SIZE = 1024 * 1024
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# 로그 한 줄 전체를 읽는 정규식 (한 번만 컴파일, 항목 사이 공백이 조금 달라도 허용)
+# split()으로 항목을 잘라 검사하는 방식보다 빠르다 (benchmark_sensor_log_parser.py 참고)
+LINE_PATTERN = re.compile(
+    r'\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})'
+    + ''.join(
+        rf',\s*{re.escape(label)}:\s*([-+0-9.eE]+)\s*{re.escape(unit)}'
+        for _, label, _, unit in TEXT_FIELDS
+    )
+    + r'\s*$'
+)
+
+
+class _TimestampParser:
+    """'YYYY-mm-dd HH:MM:SS' 문자열을 초 단위 타임스탬프로 변환 (시간 단위로 결과를 캐시)
+
+    strptime은 느리므로 'YYYY-mm-dd HH' 부분의 타임스탬프만 한 번 계산해 두고 분/초를 더한다.
+    시간 단위로 캐시하므로 서머타임 전환도 기존 datetime.timestamp()와 같게 처리된다.
+    """
+
+    def __init__(self):
+        self._hours = {}
+
+    def __call__(self, text):
+        hour = text[:13]
+        base = self._hours.get(hour)
+        if base is None:
+            base = datetime.datetime.strptime(hour, '%Y-%m-%d %H').timestamp()
+            self._hours[hour] = base
+        return base + int(text[14:16]) * 60 + int(text[17:19])
+
+
+def parse_line(line, parse_timestamp=None):
+    """로그 한 줄을 (타임스탬프, 센서 값 6개) 튜플로 변환 (형식이 맞지 않으면 None)"""
+    match = LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    parse_timestamp = parse_timestamp or _TimestampParser()
+    timestamp, *values = match.groups()
+    try:
+        return (parse_timestamp(timestamp), *map(float, values))
+    except ValueError:
+        return None
+
+
+def iter_parsed_log(file_path, skipped=None):
+    """텍스트 센서 로그를 한 줄씩 읽어 (타임스탬프, 센서 값 6개) 튜플을 내보내는 제너레이터
+
+    skipped에 리스트를 주면 형식이 맞지 않아 건너뛴 줄 번호를 기록한다.
+    """
+    parse_timestamp = _TimestampParser()
+    match_line = LINE_PATTERN.match
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
+        for line_number, line in enumerate(file, start=1):
+            match = match_line(line)
+            if match is not None:
+                timestamp, *values = match.groups()
+                try:
+                    yield (parse_timestamp(timestamp), *map(float, values))
+                    continue
+                except ValueError:
+                    pass
+            if skipped is not None and line.strip():
+                skipped.append(line_number)
+
+
+def read_log_columns(file_path):
+    """텍스트 센서 로그를 열 배열 딕셔너리('timestamp' + 센서 항목별 array('d'))로 읽음"""
+    columns = [array('d') for _ in range(len(SENSOR_KEYS) + 1)]
+    appends = [column.append for column in columns]
+    for record in iter_parsed_log(file_path):
+        for append, value in zip(appends, record):
+            append(value)
+    return dict(zip(('timestamp',) + SENSOR_KEYS, columns))
+
+
+def convert_log_to_binary(text_path, binary_path, skipped=None):
+    """텍스트 센서 로그를 BinaryLogSink 형식(56바이트 고정 길이 레코드)으로 변환하고 레코드 수를 반환"""
+    pack = SensorSample.STRUCT.pack
+    count = 0
+    buffer = bytearray()
+    with open(binary_path, 'wb') as file:
+        for record in iter_parsed_log(text_path, skipped):
+            buffer += pack(*record)
+            count += 1
+            if len(buffer) >= WRITE_CHUNK_SIZE:
+                file.write(buffer)
+                buffer.clear()
+        file.write(buffer)
+    return count
+
+
+def load_binary_columns(binary_path):
+    """BinaryLogSink 형식 파일을 열 배열 딕셔너리로 읽음 (NumPy가 있으면 한 번에 읽음)"""
+    names = ('timestamp',) + SENSOR_KEYS
+    if np is not None:
+        record_count = os.path.getsize(binary_path) // SensorSample.STRUCT.size
+        table = np.fromfile(binary_path, dtype='<f8', count=record_count * len(names)).reshape(-1, len(names))
+        return {name: table[:, i] for i, name in enumerate(names)}
+
+    columns = [array('d') for _ in names]
+    for sample in iter_binary_log(binary_path):
+        for column, name in zip(columns, names):
+            column.append(getattr(sample, name))
+    return dict(zip(names, columns))
+
+
+def load_columns(file_path):
+    """확장자에 따라 이진(.bin) 또는 텍스트 로그를 열 배열로 읽음"""
+    if os.path.splitext(file_path)[1].lower() == '.bin':
+        return load_binary_columns(file_path)
+    return read_log_columns(file_path)
+
+
+def _to_timestamp(value):
+    if isinstance(value, str):
+        value = datetime.datetime.strptime(value, TIME_FORMAT) if len(value) > 10 else \
+            datetime.datetime.strptime(value, '%Y-%m-%d')
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def average_between(columns, start, end):
+    """start 이상 end 미만 구간의 센서별 평균 (start/end: 문자열, datetime 또는 초 단위 타임스탬프)
+
+    로그는 시간순으로 기록되므로 이진 탐색으로 구간을 찾는다. 구간에 샘플이 없으면 None.
+    """
+    timestamps = columns['timestamp']
+    low = bisect.bisect_left(timestamps, _to_timestamp(start))
+    high = bisect.bisect_left(timestamps, _to_timestamp(end))
+    count = high - low
+    if count <= 0:
+        return None
+    result = {'count': count}
+    for key in SENSOR_KEYS:
+        column = columns[key]
+        if np is not None and isinstance(column, np.ndarray):
+            result[key] = float(column[low:high].mean())
+        else:
+            result[key] = sum(column[low:high]) / count
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='sensor_log.txt 변환 및 기간별 평균 조회')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    convert_parser = commands.add_parser('convert', help='텍스트 로그를 이진 로그(.bin)로 변환')
+    convert_parser.add_argument('input', nargs='?', default='sensor_log.txt')
+    convert_parser.add_argument('output', nargs='?', default='sensor_log.bin')
+
+    query_parser = commands.add_parser('query', help='기간별 센서 평균 조회 (시작 이상, 끝 미만)')
+    query_parser.add_argument('start', help="예: '2025-04-22' 또는 '2025-04-22 11:00:00'")
+    query_parser.add_argument('end')
+    query_parser.add_argument('--file', default='sensor_log.txt', help='텍스트 로그 또는 변환된 .bin 파일')
+    args = parser.parse_args()
+
+    if args.command == 'convert':
+        skipped = []
+        count = convert_log_to_binary(args.input, args.output, skipped)
+        print(f'{count}개 레코드를 {args.output}에 저장했습니다. (형식 오류로 건너뛴 줄: {len(skipped)}개)')
+        return
+
+    result = average_between(load_columns(args.file), args.start, args.end)
+    if result is None:
+        print('해당 기간의 데이터가 없습니다.')
+        return
+    print(f'{args.start} ~ {args.end} 평균 ({result.pop("count")}개 샘플)')
+    for key, value in result.items():
+        print(f'{key}: {value:.4f}')
+
+
+if __name__ == '__main__':
+    main()
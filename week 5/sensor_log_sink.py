@@ -0,0 +1,186 @@
+import atexit
+import datetime
+import os
+import struct
+import time
+
+from sensor_sample import SENSOR_KEYS, SensorSample
+
+# 버퍼가 이 크기(바이트)를 넘거나, 마지막 기록 후 이 시간(초)이 지나면 파일에 씀
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+# 사람이 읽는 로그 형식: (센서 항목, 이름, 소수점 형식, 단위)
+TEXT_FIELDS = (
+    ('mars_base_internal_temperature', 'Internal Temp', '.2f', 'C'),
+    ('mars_base_external_temperature', 'External Temp', '.2f', 'C'),
+    ('mars_base_internal_humidity', 'Internal Humidity', '.2f', '%'),
+    ('mars_base_external_illuminance', 'External Illuminance', '.2f', 'W/m2'),
+    ('mars_base_internal_co2', 'Internal CO2', '.4f', '%'),
+    ('mars_base_internal_oxygen', 'Internal O2', '.2f', '%')
+)
+
+
+class SensorLogSink:
+    """파일을 열어 둔 채 로그를 버퍼에 모았다가 크기/시간 기준으로 한 번에 쓰는 기본 클래스
+
+    프로그램이 끝날 때(atexit) 남은 버퍼를 반드시 기록한다.
+    rotate_seconds를 주면 파일의 첫 기록부터 그 시간이 지났을 때 파일을 '<이름>.1'로 옮기고 새 파일에 이어 쓴다.
+    (이전 '.1' 파일은 지워지므로 디스크에는 최근 rotate_seconds ~ 2배 기간의 로그만 남음)
+    """
+
+    binary = False
+
+    def __init__(self, file_path, buffer_size=DEFAULT_BUFFER_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL,
+                 rotate_seconds=None):
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.rotate_seconds = rotate_seconds
+        self._buffer = []
+        self._buffered_size = 0
+        self._last_flush = time.monotonic()
+        self.write_count = 0  # 실제로 파일에 쓴 횟수 (성능 확인용)
+        self._open()
+        atexit.register(self.close)
+
+    def _open(self):
+        is_new_file = not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0
+        # 이어 쓰는 파일이면 첫 기록의 시각을 읽어 교체 시점을 계산
+        self._file_start = None if is_new_file or self.rotate_seconds is None else self._read_first_timestamp()
+        if self.binary:
+            self._file = open(self.file_path, 'ab')
+        else:
+            self._file = open(self.file_path, 'a', encoding='utf-8')
+        if is_new_file:
+            header = self.header()
+            if header:
+                self._append(header)
+
+    def _read_first_timestamp(self):
+        try:
+            with open(self.file_path, 'rb') as file:
+                return self.parse_first_timestamp(file)
+        except (OSError, ValueError, struct.error):
+            return None  # 알 수 없으면 다음 기록 시각부터 계산
+
+    def parse_first_timestamp(self, file):
+        """파일(바이너리 모드)의 첫 기록 시각 (형식마다 재정의)"""
+        return None
+
+    def rotate(self):
+        """지금까지의 파일을 '<이름>.1'로 옮기고 새 파일을 엶"""
+        self.flush()
+        self._file.close()
+        os.replace(self.file_path, self.file_path + '.1')
+        self._open()
+
+    def header(self):
+        """새 파일을 만들 때 처음에 쓸 내용 (필요한 형식만 재정의)"""
+        return None
+
+    def format(self, timestamp, values):
+        raise NotImplementedError
+
+    def _append(self, record):
+        self._buffer.append(record)
+        self._buffered_size += len(record)
+
+    def write(self, timestamp, values):
+        """로그 한 건을 버퍼에 추가하고, 기준을 넘으면 파일에 씀"""
+        if self._file is None:
+            raise ValueError('이미 닫힌 로그 파일입니다.')
+        if self.rotate_seconds is not None:
+            if self._file_start is None:
+                self._file_start = timestamp
+            elif timestamp - self._file_start >= self.rotate_seconds:
+                self.rotate()
+                self._file_start = timestamp
+        self._append(self.format(timestamp, values))
+        if (self._buffered_size >= self.buffer_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        if self._buffer and self._file is not None:
+            empty = b'' if self.binary else ''
+            self._file.write(empty.join(self._buffer))
+            self._file.flush()
+            self.write_count += 1
+            self._buffer = []
+            self._buffered_size = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class TextLogSink(SensorLogSink):
+    """기존 sensor_log.txt와 같은 사람이 읽는 형식"""
+
+    def format(self, timestamp, values):
+        fields = ', '.join(
+            f'{label}: {values[key]:{spec}} {unit}' for key, label, spec, unit in TEXT_FIELDS
+        )
+        return f'{datetime.datetime.fromtimestamp(timestamp):%Y-%m-%d %H:%M:%S}, {fields}\n'
+
+    def parse_first_timestamp(self, file):
+        return time.mktime(time.strptime(file.readline()[:19].decode('utf-8'), '%Y-%m-%d %H:%M:%S'))
+
+
+class CsvLogSink(SensorLogSink):
+    """timestamp(초) + 센서 항목별 값 CSV 형식 (다시 읽을 때 float()만 하면 됨)"""
+
+    def header(self):
+        return 'timestamp,' + ','.join(SENSOR_KEYS) + '\n'
+
+    def format(self, timestamp, values):
+        return f'{timestamp!r},' + ','.join(repr(float(values[key])) for key in SENSOR_KEYS) + '\n'
+
+    def parse_first_timestamp(self, file):
+        file.readline()  # 헤더 건너뛰기
+        return float(file.readline().split(b',')[0])
+
+
+class BinaryLogSink(SensorLogSink):
+    """SensorSample.STRUCT 형식(float64 7개, 56바이트)의 고정 길이 레코드"""
+
+    binary = True
+
+    def format(self, timestamp, values):
+        return SensorSample.STRUCT.pack(timestamp, *(values[key] for key in SENSOR_KEYS))
+
+    def parse_first_timestamp(self, file):
+        return struct.unpack('<d', file.read(8))[0]
+
+
+def iter_csv_log(file_path):
+    """CsvLogSink로 만든 파일을 SensorSample로 읽는 제너레이터"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        file.readline()  # 헤더 건너뛰기
+        for line in file:
+            yield SensorSample(*map(float, line.split(',')))
+
+
+def iter_binary_log(file_path, chunk_records=4096):
+    """BinaryLogSink로 만든 파일을 SensorSample로 읽는 제너레이터"""
+    record_size = SensorSample.STRUCT.size
+    with open(file_path, 'rb') as file:
+        while True:
+            chunk = file.read(record_size * chunk_records)
+            usable = len(chunk) - len(chunk) % record_size  # 쓰는 중에 잘린 마지막 레코드는 제외
+            if not usable:
+                break
+            for values in SensorSample.STRUCT.iter_unpack(chunk[:usable]):
+                yield SensorSample(*values)
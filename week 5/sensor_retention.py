@@ -0,0 +1,290 @@
+import math
+import os
+import struct
+import time
+
+from sensor_log_sink import BinaryLogSink
+from sensor_sample import SENSOR_KEYS, SensorSample
+
+RETENTION_DIR = 'sensor_retention'
+
+# 단계별 보관 기간 (초, None이면 지우지 않음)
+RAW_RETENTION_SECONDS = 24 * 60 * 60
+MINUTE_RETENTION_SECONDS = 30 * 24 * 60 * 60
+HOUR_RETENTION_SECONDS = None
+
+# 집계 레코드: 구간 시작(float64), 샘플 수(uint32), 항목별 평균/최소/최대(float32) = 84바이트
+AGGREGATE_STRUCT = struct.Struct('<dI' + 'fff' * len(SENSOR_KEYS))
+
+
+def _find_record(file, record_size, record_count, timestamp):
+    """시간순으로 저장된 고정 길이 레코드에서 timestamp 이상인 첫 레코드 번호 (이진 탐색)"""
+    low, high = 0, record_count
+    while low < high:
+        middle = (low + high) // 2
+        file.seek(middle * record_size)
+        if struct.unpack('<d', file.read(8))[0] < timestamp:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def read_records(file_path, record_struct, start, end):
+    """start 이상 end 미만 구간의 레코드를 튜플 리스트로 읽음 (파일이 없으면 빈 리스트)"""
+    try:
+        size = os.path.getsize(file_path)
+    except FileNotFoundError:
+        return []
+    record_size = record_struct.size
+    record_count = size // record_size
+    with open(file_path, 'rb') as file:
+        first = _find_record(file, record_size, record_count, start)
+        last = _find_record(file, record_size, record_count, end)
+        file.seek(first * record_size)
+        return list(record_struct.iter_unpack(file.read((last - first) * record_size)))
+
+
+def prune_records(file_path, record_struct, cutoff):
+    """cutoff보다 오래된 레코드를 지우고 지운 개수를 반환 (남길 부분만 새 파일에 쓴 뒤 교체)"""
+    try:
+        size = os.path.getsize(file_path)
+    except FileNotFoundError:
+        return 0
+    record_size = record_struct.size
+    with open(file_path, 'rb') as file:
+        first = _find_record(file, record_size, size // record_size, cutoff)
+        if first == 0:
+            return 0
+        file.seek(first * record_size)
+        temp_path = file_path + '.tmp'
+        with open(temp_path, 'wb') as temp_file:
+            while True:
+                chunk = file.read(1024 * 1024)
+                if not chunk:
+                    break
+                temp_file.write(chunk)
+    os.replace(temp_path, file_path)
+    return first
+
+
+class _Bucket:
+    """집계 구간 하나의 샘플 수와 항목별 합계/최소/최대"""
+
+    __slots__ = ('start', 'count', 'sums', 'minimums', 'maximums')
+
+    def __init__(self, start):
+        self.start = start
+        self.count = 0
+        self.sums = [0.0] * len(SENSOR_KEYS)
+        self.minimums = [math.inf] * len(SENSOR_KEYS)
+        self.maximums = [-math.inf] * len(SENSOR_KEYS)
+
+    def add(self, values):
+        self.count += 1
+        for i, value in enumerate(values):
+            self.sums[i] += value
+            if value < self.minimums[i]:
+                self.minimums[i] = value
+            if value > self.maximums[i]:
+                self.maximums[i] = value
+
+    def pack(self):
+        fields = []
+        for total, minimum, maximum in zip(self.sums, self.minimums, self.maximums):
+            fields += (total / self.count, minimum, maximum)
+        return AGGREGATE_STRUCT.pack(self.start, self.count, *fields)
+
+    def as_row(self):
+        return _make_row(self.start, self.count, [total / self.count for total in self.sums],
+                         self.minimums, self.maximums)
+
+
+def _make_row(start, count, means, minimums, maximums):
+    return {
+        'start': start,
+        'count': count,
+        'mean': dict(zip(SENSOR_KEYS, means)),
+        'min': dict(zip(SENSOR_KEYS, minimums)),
+        'max': dict(zip(SENSOR_KEYS, maximums))
+    }
+
+
+def _unpack_row(record):
+    start, count, *fields = record
+    return _make_row(start, count, fields[0::3], fields[1::3], fields[2::3])
+
+
+class RawTier:
+    """원본 샘플 단계 (BinaryLogSink 형식 파일)"""
+
+    bucket_seconds = 0
+
+    def __init__(self, file_path, retention_seconds):
+        self.name = 'raw'
+        self.file_path = file_path
+        self.retention_seconds = retention_seconds
+        self._sink = BinaryLogSink(file_path)
+
+    def add(self, sample, values):
+        self._sink.write(sample.timestamp, sample)
+
+    def query(self, start, end):
+        self._sink.flush()
+        return [
+            _make_row(timestamp, 1, values, values, values)
+            for timestamp, *values in read_records(self.file_path, SensorSample.STRUCT, start, end)
+        ]
+
+    def prune(self, now):
+        if self.retention_seconds is None:
+            return 0
+        # 열어 둔 파일은 교체되기 전 파일을 가리키므로 닫았다가 다시 엶
+        self._sink.close()
+        removed = prune_records(self.file_path, SensorSample.STRUCT, now - self.retention_seconds)
+        self._sink = BinaryLogSink(self.file_path)
+        return removed
+
+    def close(self):
+        self._sink.close()
+
+
+class AggregateTier:
+    """bucket_seconds 단위로 평균/최소/최대/샘플 수를 모아 저장하는 단계"""
+
+    def __init__(self, name, file_path, bucket_seconds, retention_seconds):
+        self.name = name
+        self.file_path = file_path
+        self.bucket_seconds = bucket_seconds
+        self.retention_seconds = retention_seconds
+        self._bucket = None
+
+    def add(self, sample, values):
+        start = sample.timestamp - sample.timestamp % self.bucket_seconds
+        if self._bucket is None or start != self._bucket.start:
+            self._write_bucket()
+            self._bucket = _Bucket(start)
+        self._bucket.add(values)
+
+    def _write_bucket(self):
+        # 구간이 끝날 때 한 번만 기록 (1분 단계도 분당 84바이트 한 번)
+        if self._bucket is not None and self._bucket.count:
+            with open(self.file_path, 'ab') as file:
+                file.write(self._bucket.pack())
+        self._bucket = None
+
+    def query(self, start, end):
+        rows = [_unpack_row(record) for record in read_records(self.file_path, AGGREGATE_STRUCT, start, end)]
+        # 아직 기록하지 않은 현재 구간도 포함
+        if self._bucket is not None and self._bucket.count and start <= self._bucket.start < end:
+            rows.append(self._bucket.as_row())
+        return rows
+
+    def prune(self, now):
+        if self.retention_seconds is None:
+            return 0
+        return prune_records(self.file_path, AGGREGATE_STRUCT, now - self.retention_seconds)
+
+    def close(self):
+        # 끝나지 않은 구간도 저장 (다시 시작한 뒤 같은 구간의 레코드가 또 생기면 조회할 때 합쳐짐)
+        self._write_bucket()
+
+
+def merge_rows(rows, resolution):
+    """행들을 resolution초 단위 구간으로 합침 (평균은 샘플 수로 가중 평균)"""
+    merged = {}
+    for row in rows:
+        start = row['start'] - row['start'] % resolution
+        target = merged.get(start)
+        if target is None:
+            merged[start] = {
+                'start': start,
+                'count': row['count'],
+                'mean': dict(row['mean']),
+                'min': dict(row['min']),
+                'max': dict(row['max'])
+            }
+            continue
+        total = target['count'] + row['count']
+        for key in SENSOR_KEYS:
+            target['mean'][key] += (row['mean'][key] - target['mean'][key]) * row['count'] / total
+            target['min'][key] = min(target['min'][key], row['min'][key])
+            target['max'][key] = max(target['max'][key], row['max'][key])
+        target['count'] = total
+    return [merged[start] for start in sorted(merged)]
+
+
+class SensorRetention:
+    """센서 기록을 원본/1분/1시간 단계로 나눠 보관하는 클래스
+
+    원본은 최근 raw_retention초만 남기고, 오래된 기록은 1분/1시간 집계(평균/최소/최대/샘플 수)로만 남는다.
+    조회할 때는 요청한 해상도를 만족하는 가장 거친 단계를 골라 읽는다.
+    """
+
+    def __init__(self, directory=RETENTION_DIR, raw_retention=RAW_RETENTION_SECONDS,
+                 minute_retention=MINUTE_RETENTION_SECONDS, hour_retention=HOUR_RETENTION_SECONDS):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        # 가는 단계부터 거친 단계 순서
+        self.tiers = (
+            RawTier(os.path.join(directory, 'raw.bin'), raw_retention),
+            AggregateTier('1m', os.path.join(directory, 'minute.bin'), 60, minute_retention),
+            AggregateTier('1h', os.path.join(directory, 'hour.bin'), 60 * 60, hour_retention)
+        )
+        self.latest_timestamp = None
+        self._pruned_hour = None
+
+    def add(self, sample):
+        values = [sample[key] for key in SENSOR_KEYS]
+        for tier in self.tiers:
+            tier.add(sample, values)
+        self.latest_timestamp = sample.timestamp
+
+        # 오래된 기록 정리는 한 시간에 한 번만
+        hour = sample.timestamp // 3600
+        if hour != self._pruned_hour:
+            self._pruned_hour = hour
+            self.prune(sample.timestamp)
+
+    def prune(self, now=None):
+        now = self._now(now)
+        return {tier.name: tier.prune(now) for tier in self.tiers}
+
+    def _now(self, now):
+        if now is not None:
+            return now
+        return self.latest_timestamp if self.latest_timestamp is not None else time.time()
+
+    def choose_tier(self, start, resolution=0, now=None):
+        """start부터의 기록을 resolution초 해상도로 조회할 때 읽을 단계
+
+        해상도를 만족하면서(bucket_seconds <= resolution) start 시점의 기록이 남아 있는 가장 거친 단계.
+        그런 단계가 없으면 start 시점의 기록이 남아 있는 가장 가는 단계를 사용한다.
+        """
+        now = self._now(now)
+
+        def covers(tier):
+            return tier.retention_seconds is None or start >= now - tier.retention_seconds
+
+        available = [tier for tier in self.tiers if covers(tier)]
+        if not available:
+            return self.tiers[-1]
+        fitting = [tier for tier in available if tier.bucket_seconds <= resolution]
+        return fitting[-1] if fitting else available[0]
+
+    def query(self, start, end, resolution=0, now=None):
+        """start 이상 end 미만 구간의 기록을 resolution초 단위 행으로 반환
+
+        각 행은 {'start', 'count', 'mean', 'min', 'max'} 딕셔너리이며 mean/min/max는 센서 항목별 값이다.
+        """
+        tier = self.choose_tier(start, resolution, now)
+        rows = tier.query(start, end)
+        resolution = max(resolution, tier.bucket_seconds)
+        if resolution:
+            # 더 거친 해상도 요청과, 재시작으로 같은 구간의 레코드가 여러 개인 경우를 함께 처리
+            rows = merge_rows(rows, resolution)
+        return rows
+
+    def close(self):
+        for tier in self.tiers:
+            tier.close()
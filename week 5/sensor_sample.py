@@ -0,0 +1,50 @@
+import struct  # 샘플을 고정 길이 바이트로 변환
+
+# 센서 항목 이름 (순서가 샘플/로그의 열 순서)
+SENSOR_KEYS = (
+    'mars_base_internal_temperature',
+    'mars_base_external_temperature',
+    'mars_base_internal_humidity',
+    'mars_base_external_illuminance',
+    'mars_base_internal_co2',
+    'mars_base_internal_oxygen'
+)
+
+
+# SensorSample 클래스 - 측정 한 번의 값을 담는 작은 불변 레코드
+class SensorSample:
+    __slots__ = ('timestamp',) + SENSOR_KEYS
+
+    # 타임스탬프 + 센서 값 6개 = float64 7개 (56바이트)
+    STRUCT = struct.Struct('<7d')
+
+    def __init__(self, timestamp, *values):
+        object.__setattr__(self, 'timestamp', timestamp)
+        for key, value in zip(SENSOR_KEYS, values):
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('SensorSample은 변경할 수 없습니다.')
+
+    @classmethod
+    def from_dict(cls, timestamp, values):
+        return cls(timestamp, *(values[key] for key in SENSOR_KEYS))
+
+    def __getitem__(self, key):
+        # sample['mars_base_internal_temperature'] 처럼 딕셔너리와 같은 방식으로 조회
+        if key not in SENSOR_KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def as_dict(self):
+        return {key: getattr(self, key) for key in SENSOR_KEYS}
+
+    def pack(self):
+        return self.STRUCT.pack(self.timestamp, *(getattr(self, key) for key in SENSOR_KEYS))
+
+    @classmethod
+    def unpack(cls, data):
+        return cls(*cls.STRUCT.unpack(data))
+
+    def __repr__(self):
+        return f'SensorSample(timestamp={self.timestamp}, {self.as_dict()})'
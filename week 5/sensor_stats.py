@@ -0,0 +1,336 @@
+import math
+from collections import deque
+
+# 기본 통계 구간 (이름: 초)
+DEFAULT_WINDOWS = {'1m': 60, '5m': 5 * 60, '1h': 60 * 60, '24h': 24 * 60 * 60}
+
+# 샘플을 묶는 기본 단위 구간 (초)
+PANE_SECONDS = 10
+# 기본 pane을 다시 묶는 굵은 단위 구간 (초). 긴 통계 구간은 굵은 pane 단위로 앞으로 밀려난다.
+ROLLUP_SECONDS = (60, 10 * 60)
+# 각 통계 구간은 pane 하나가 구간 길이의 1/PANES_PER_WINDOW 이하인 가장 굵은 단위를 사용
+# (1m/5m: 10초, 1h: 1분, 24h: 10분)
+PANES_PER_WINDOW = 60
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class RunningStats:
+    """Welford 방식의 개수/평균/분산/최소/최대 (다른 RunningStats와 합치거나 뺄 수 있음)"""
+
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other):
+        """다른 집계를 더함 (Chan의 병렬 분산 공식)"""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def remove(self, other):
+        """merge()의 역연산 (최소/최대는 되돌릴 수 없으므로 호출한 쪽에서 따로 관리)"""
+        remaining = self.count - other.count
+        if remaining <= 0:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        mean = (self.count * self.mean - other.count * other.mean) / remaining
+        delta = other.mean - mean
+        self.m2 = max(0.0, self.m2 - other.m2 - delta * delta * remaining * other.count / self.count)
+        self.mean = mean
+        self.count = remaining
+
+    @property
+    def variance(self):
+        """모분산"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def stddev(self):
+        return math.sqrt(self.variance)
+
+
+class QuantileSketch:
+    """상대 오차가 보장되는 로그 구간 히스토그램 (DDSketch 방식, 합치기/빼기 가능)"""
+
+    __slots__ = ('relative_accuracy', '_log_gamma', 'positive', 'negative', 'zero_count', 'count')
+
+    MIN_VALUE = 1e-9  # 이보다 절댓값이 작은 값은 0으로 취급
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self.positive = {}
+        self.negative = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, value):
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key):
+        gamma = math.exp(self._log_gamma)
+        return 2 * gamma ** key / (gamma + 1)
+
+    def add(self, value):
+        self.count += 1
+        if value > self.MIN_VALUE:
+            key = self._key(value)
+            self.positive[key] = self.positive.get(key, 0) + 1
+        elif value < -self.MIN_VALUE:
+            key = self._key(-value)
+            self.negative[key] = self.negative.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+
+    def merge(self, other, sign=1):
+        """다른 스케치의 개수를 더함 (sign=-1이면 뺌)"""
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in theirs.items():
+                total = mine.get(key, 0) + sign * count
+                if total:
+                    mine[key] = total
+                else:
+                    mine.pop(key, None)
+        self.zero_count += sign * other.zero_count
+        self.count += sign * other.count
+
+    def subtract(self, other):
+        self.merge(other, sign=-1)
+
+    def quantile(self, q):
+        """q(0~1) 분위수의 근삿값 (비어 있으면 None)"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self.negative, reverse=True):  # 가장 작은(절댓값이 큰 음수) 값부터
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self.positive)) if self.positive else 0.0
+
+
+class _Pane:
+    """PANE_SECONDS 동안의 샘플을 센서 항목별로 집계한 묶음"""
+
+    __slots__ = ('start', 'stats', 'sketches')
+
+    def __init__(self, start, key_count, relative_accuracy):
+        self.start = start
+        self.stats = [RunningStats() for _ in range(key_count)]
+        self.sketches = [QuantileSketch(relative_accuracy) for _ in range(key_count)]
+
+    def merge(self, other):
+        for i, stats in enumerate(other.stats):
+            self.stats[i].merge(stats)
+            self.sketches[i].merge(other.sketches[i])
+
+
+class _Level:
+    """같은 길이의 pane을 사용하는 통계 구간들과 지금 채우는 중인 pane"""
+
+    __slots__ = ('seconds', 'current', 'windows')
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.current = None
+        self.windows = []
+
+
+class _Window:
+    """하나의 통계 구간: 단위 구간(pane) 큐와 그 합계, 최소/최대용 단조 덱"""
+
+    def __init__(self, seconds, level, key_count, relative_accuracy):
+        self.seconds = seconds
+        self.level = level  # 사용하는 pane 단위 (SensorStatistics의 단계 번호)
+        self.key_count = key_count
+        self.relative_accuracy = relative_accuracy
+        self.panes = deque()
+        self.stats = [RunningStats() for _ in range(key_count)]
+        self.sketches = [QuantileSketch(relative_accuracy) for _ in range(key_count)]
+        self.max_deques = [deque() for _ in range(key_count)]  # (pane, 최댓값), 값이 감소하는 순서
+        self.min_deques = [deque() for _ in range(key_count)]  # (pane, 최솟값), 값이 증가하는 순서
+        self._removals = 0
+
+    def push(self, pane):
+        self.panes.append(pane)
+        for i in range(self.key_count):
+            stats = pane.stats[i]
+            self.stats[i].merge(stats)
+            self.sketches[i].merge(pane.sketches[i])
+
+            max_deque = self.max_deques[i]
+            while max_deque and max_deque[-1][1] <= stats.maximum:
+                max_deque.pop()
+            max_deque.append((pane, stats.maximum))
+
+            min_deque = self.min_deques[i]
+            while min_deque and min_deque[-1][1] >= stats.minimum:
+                min_deque.pop()
+            min_deque.append((pane, stats.minimum))
+
+    def evict_before(self, cutoff):
+        """시작 시각이 cutoff보다 이른 pane을 구간에서 제외"""
+        while self.panes and self.panes[0].start < cutoff:
+            pane = self.panes.popleft()
+            for i in range(self.key_count):
+                self.stats[i].remove(pane.stats[i])
+                self.sketches[i].subtract(pane.sketches[i])
+                if self.max_deques[i] and self.max_deques[i][0][0] is pane:
+                    self.max_deques[i].popleft()
+                if self.min_deques[i] and self.min_deques[i][0][0] is pane:
+                    self.min_deques[i].popleft()
+
+            # 빼기를 반복하면 부동소수점 오차가 쌓이므로, pane 수만큼 뺄 때마다 다시 합산 (분할 상환 O(1))
+            self._removals += 1
+            if self._removals >= max(1, len(self.panes)):
+                self._rebuild_stats()
+
+    def _rebuild_stats(self):
+        self._removals = 0
+        self.stats = [RunningStats() for _ in range(self.key_count)]
+        for pane in self.panes:
+            for i in range(self.key_count):
+                self.stats[i].merge(pane.stats[i])
+
+
+class SensorStatistics:
+    """여러 시간 구간의 센서별 통계(평균/표준편차/최소/최대/분위수)를 스트리밍으로 계산하는 클래스
+
+    샘플은 가장 가는 단위 구간(pane) 하나에만 더해지므로 샘플당 비용은 구간 개수와 무관하다.
+    pane이 끝나면 같은 단위를 쓰는 구간에만 넣고(오래된 pane은 뺌), 한 단계 굵은 pane에 합친다.
+    1h/24h처럼 긴 구간은 1분/10분 pane이 끝날 때만 갱신되므로 10초마다 모든 구간을 갱신하지 않는다.
+    """
+
+    def __init__(self, keys, windows=None, pane_seconds=PANE_SECONDS, relative_accuracy=0.01,
+                 rollup_seconds=ROLLUP_SECONDS):
+        self.keys = tuple(keys)
+        self.pane_seconds = pane_seconds
+        self.relative_accuracy = relative_accuracy
+        windows = DEFAULT_WINDOWS if windows is None else windows
+
+        # 단계별 pane 길이: 앞 단계의 배수인 것만 사용
+        pane_sizes = [pane_seconds]
+        for seconds in rollup_seconds:
+            if seconds > pane_sizes[-1] and seconds % pane_sizes[-1] == 0:
+                pane_sizes.append(seconds)
+
+        self.windows = {}
+        for name, seconds in windows.items():
+            level = max(i for i, size in enumerate(pane_sizes) if i == 0 or size * PANES_PER_WINDOW <= seconds)
+            self.windows[name] = _Window(seconds, level, len(self.keys), relative_accuracy)
+        # 가장 굵은 pane을 쓰는 구간까지만 단계를 만듦
+        level_count = max((window.level for window in self.windows.values()), default=0) + 1
+        self._levels = [_Level(size) for size in pane_sizes[:level_count]]
+        for window in self.windows.values():
+            self._levels[window.level].windows.append(window)
+
+    def _cutoff(self, window, pane_start):
+        # 현재 pane을 포함해 구간 길이만큼의 pane만 남김
+        return pane_start - window.seconds + self._levels[window.level].seconds
+
+    def add(self, timestamp, values):
+        """샘플 하나를 추가 (timestamp: 초 단위 float, values: 센서 항목별 값)"""
+        level = self._levels[0]
+        pane_start = timestamp - timestamp % level.seconds
+        current = level.current
+        if current is None or pane_start > current.start:
+            if current is not None:
+                self._close_pane(0, pane_start)
+            current = level.current = _Pane(pane_start, len(self.keys), self.relative_accuracy)
+
+        for i, key in enumerate(self.keys):
+            value = values[key]
+            current.stats[i].add(value)
+            current.sketches[i].add(value)
+
+    def _close_pane(self, index, next_start):
+        """index 단계의 현재 pane을 끝냄 (next_start: 다음 pane의 시작 시각)"""
+        level = self._levels[index]
+        pane = level.current
+        level.current = None
+        for window in level.windows:
+            window.push(pane)
+            window.evict_before(self._cutoff(window, next_start))
+
+        if index + 1 < len(self._levels):
+            parent = self._levels[index + 1]
+            parent_start = pane.start - pane.start % parent.seconds
+            if parent.current is None or parent_start > parent.current.start:
+                if parent.current is not None:
+                    self._close_pane(index + 1, parent_start)
+                parent.current = _Pane(parent_start, len(self.keys), self.relative_accuracy)
+            parent.current.merge(pane)
+
+    def summary(self, window_name, now=None, quantiles=DEFAULT_QUANTILES):
+        """구간의 센서별 통계 딕셔너리 (now를 주면 그 시각 기준으로 오래된 데이터를 제외)"""
+        window = self.windows[window_name]
+        # 아직 구간에 넣지 않은 샘플: 구간의 단계와 그보다 가는 단계에서 채우는 중인 pane (서로 겹치지 않음)
+        open_panes = [level.current for level in self._levels[:window.level + 1] if level.current is not None]
+        if now is None and open_panes:
+            # 굵은 pane은 다음 가는 pane이 끝날 때에야 닫히므로, 마지막 샘플 시각 기준으로 다시 잘라냄
+            now = open_panes[0].start
+        if now is not None:
+            level_seconds = self._levels[window.level].seconds
+            cutoff = self._cutoff(window, now - now % level_seconds)
+            window.evict_before(cutoff)
+            open_panes = [pane for pane in open_panes if pane.start >= cutoff]
+
+        result = {}
+        for i, key in enumerate(self.keys):
+            stats = RunningStats()
+            stats.merge(window.stats[i])
+            # 합계의 최소/최대는 뺄 수 없으므로 단조 덱의 맨 앞 값을 사용
+            if window.max_deques[i]:
+                stats.minimum = window.min_deques[i][0][1]
+                stats.maximum = window.max_deques[i][0][1]
+            else:
+                stats.minimum, stats.maximum = math.inf, -math.inf
+            sketch = QuantileSketch(self.relative_accuracy)
+            sketch.merge(window.sketches[i])
+            for pane in open_panes:
+                stats.merge(pane.stats[i])
+                sketch.merge(pane.sketches[i])
+
+            if stats.count == 0:
+                result[key] = {'count': 0}
+                continue
+            result[key] = {
+                'count': stats.count,
+                'mean': stats.mean,
+                'stddev': stats.stddev,
+                'min': stats.minimum,
+                'max': stats.maximum
+            }
+            for q in quantiles:
+                result[key][f'p{round(q * 100)}'] = sketch.quantile(q)
+        return result
@@ -0,0 +1,114 @@
+import os
+import threading
+
+SETTINGS_FILE = 'setting.txt'
+DEFAULT_CHECK_INTERVAL = 2.0  # 설정 파일 변경 여부를 확인하는 간격 (초)
+
+# 설정 파일이 없거나 항목이 빠졌을 때 사용하는 값 (모두 켬)
+DEFAULT_SETTINGS = {
+    'os': True,
+    'os_version': True,
+    'cpu_type': True,
+    'cpu_cores': True,
+    'memory': True,
+    'cpu_usage': True,
+    'memory_usage': True
+}
+
+
+def parse_settings(lines):
+    """'항목=True/False' 형식의 줄들을 읽어 (설정 딕셔너리, 문제 목록)을 반환
+
+    빈 줄과 '#' 주석은 건너뛰고, 알 수 없는 항목이나 True/False가 아닌 값은 무시하고 문제 목록에 남긴다.
+    """
+    settings = dict(DEFAULT_SETTINGS)
+    problems = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if '=' not in line:
+            problems.append(f'{line_number}번째 줄: "항목=값" 형식이 아닙니다. ({line})')
+            continue
+        key, value = (part.strip() for part in line.split('=', 1))
+        if key not in DEFAULT_SETTINGS:
+            problems.append(f'{line_number}번째 줄: 알 수 없는 항목입니다. ({key})')
+            continue
+        if value.lower() not in ('true', 'false'):
+            problems.append(f'{line_number}번째 줄: {key} 값은 True 또는 False여야 합니다. ({value})')
+            continue
+        settings[key] = value.lower() == 'true'
+    return settings, problems
+
+
+class SettingsWatcher:
+    """설정 파일을 주기적으로 확인해서 바뀌었을 때만 다시 읽는 클래스
+
+    파일의 수정 시각/크기가 달라졌을 때만 내용을 읽고, 검증한 새 딕셔너리를 settings에 통째로 바꿔 넣는다.
+    읽는 쪽은 잠금 없이 settings를 사용하면 된다. 설정이 실제로 바뀌면 on_change(settings)를 호출한다.
+    """
+
+    def __init__(self, file_path=SETTINGS_FILE, interval=DEFAULT_CHECK_INTERVAL, on_change=None):
+        self.file_path = file_path
+        self.interval = interval
+        self.on_change = None
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.problems = []
+        self._signature = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.check()  # 처음 읽은 설정은 on_change 없이 바로 사용
+        self.on_change = on_change
+
+    def _stat_signature(self):
+        try:
+            stat = os.stat(self.file_path)
+        except FileNotFoundError:
+            return 'missing'
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self):
+        """파일이 바뀌었으면 다시 읽고, 설정이 바뀌었으면 True를 반환"""
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+
+        if signature == 'missing':
+            settings, problems = dict(DEFAULT_SETTINGS), []
+        else:
+            try:
+                with open(self.file_path, 'r', encoding='utf-8') as file:
+                    settings, problems = parse_settings(file)
+            except (OSError, UnicodeDecodeError) as e:
+                # 읽는 도중 실패하면 기존 설정을 유지하고 다음 확인 때 다시 시도
+                self._signature = None
+                self.problems = [str(e)]
+                return False
+
+        self.problems = problems
+        for problem in problems:
+            print(f'[설정] {self.file_path} {problem}')
+        if settings == self.settings:
+            return False
+        self.settings = settings
+        if self.on_change is not None:
+            self.on_change(settings)
+        return True
+
+    def start(self):
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='SettingsWatcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval):
+            self.check()
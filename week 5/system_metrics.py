@@ -0,0 +1,105 @@
+import os
+import platform
+import threading
+import time
+
+import psutil
+
+DEFAULT_SAMPLE_INTERVAL = 1.0  # 부하 정보를 갱신하는 간격 (초)
+LOAD_METRICS = ('cpu_usage', 'memory_usage')
+
+# 실행 중에 바뀌지 않는 시스템 정보 항목과 조회 함수
+STATIC_INFO = {
+    'os': platform.system,
+    'os_version': platform.version,
+    'cpu_type': platform.processor,
+    'cpu_cores': os.cpu_count,
+    'memory': lambda: str(round(psutil.virtual_memory().total / (1024 ** 3), 2)) + ' GB'
+}
+
+
+def collect_static_info(keys=None):
+    """바뀌지 않는 시스템 정보 중 keys 항목만 조회 (keys가 없으면 전체, 항목마다 한 번만 조회하면 됨)"""
+    info = {}
+    try:
+        for key, query in STATIC_INFO.items():
+            if keys is None or key in keys:
+                info[key] = query()
+    except Exception as e:
+        info['error'] = str(e)
+    return info
+
+
+class MetricsSampler:
+    """백그라운드 스레드에서 CPU/메모리 사용량을 주기적으로 측정하는 클래스
+
+    측정할 때마다 새 딕셔너리를 만들어 snapshot에 통째로 바꿔 넣으므로(참조 대입은 원자적),
+    읽는 쪽은 잠금 없이 항상 완성된 측정 결과를 바로 얻는다.
+    """
+
+    def __init__(self, interval=DEFAULT_SAMPLE_INTERVAL, metrics=LOAD_METRICS):
+        if interval <= 0:
+            raise ValueError('interval은 0보다 커야 합니다.')
+        self.interval = interval
+        self.metrics = frozenset(metrics)
+        self.snapshot = {}
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._thread = None
+
+    def set_metrics(self, metrics):
+        """측정할 항목을 바꿈 (꺼진 항목은 더 이상 측정하지 않음)"""
+        metrics = frozenset(metrics)
+        if 'cpu_usage' in metrics and 'cpu_usage' not in self.metrics:
+            # 다시 켠 경우 꺼져 있던 기간 전체의 평균이 나오지 않도록 기준 시점을 새로 잡음
+            psutil.cpu_percent(interval=None)
+        self.metrics = metrics
+
+    def start(self, wait=True):
+        """측정 스레드 시작 (wait=True면 첫 측정 결과가 나올 때까지 기다림)"""
+        if self._thread is not None:
+            return self
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='MetricsSampler', daemon=True)
+        self._thread.start()
+        if wait:
+            self._ready.wait(self.interval + 1.0)
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        # cpu_percent(interval=None)는 직전 호출 이후의 사용률이므로, 첫 값만 짧게 측정해서 기준을 만듦
+        if 'cpu_usage' in self.metrics:
+            first_cpu = psutil.cpu_percent(interval=min(0.1, self.interval))
+        else:
+            first_cpu = None
+        self._sample(first_cpu)
+        self._ready.set()
+        while not self._stop_event.wait(self.interval):
+            self._sample()
+
+    def _sample(self, cpu_usage=None):
+        metrics = self.metrics  # 측정 도중 set_metrics()가 호출돼도 한 번의 측정은 같은 항목으로
+        snapshot = {}
+        try:
+            if 'cpu_usage' in metrics:
+                if cpu_usage is None:
+                    cpu_usage = psutil.cpu_percent(interval=None)
+                snapshot['cpu_usage'] = str(cpu_usage) + ' %'
+            if 'memory_usage' in metrics:
+                snapshot['memory_usage'] = str(psutil.virtual_memory().percent) + ' %'
+        except Exception as e:
+            snapshot['error'] = str(e)
+        snapshot['sampled_at'] = time.time()
+        self.snapshot = snapshot
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
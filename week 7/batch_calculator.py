@@ -0,0 +1,101 @@
+import argparse
+import collections
+import itertools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from calculator_engine import CalculatorEngine
+from expression import DEFAULT_PRECISION
+
+CHUNK_SIZE = 10000  # 작업 프로세스에 한 번에 넘기는 줄 수
+ERROR_RESULTS = ('Error', 'Divide by 0 Error')
+
+_engine = None  # 작업 프로세스마다 하나씩 만드는 엔진 (식 컴파일 캐시도 프로세스별)
+
+
+def _init_worker(mode, precision):
+    global _engine
+    _engine = CalculatorEngine(mode, precision)
+
+
+def evaluate_lines(lines):
+    """식 줄 목록을 계산해서 결과 문자열 목록을 반환 (빈 줄은 빈 결과)"""
+    results = []
+    for line in lines:
+        line = line.strip()
+        results.append(_engine.evaluate(line)[0] if line else '')
+    return results
+
+
+def iter_chunks(lines, chunk_size):
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_results(lines, mode='float', precision=DEFAULT_PRECISION, workers=1, chunk_size=CHUNK_SIZE):
+    """줄마다 계산 결과를 입력 순서대로 돌려줌
+
+    workers가 2 이상이면 chunk_size줄씩 나눠 여러 프로세스에서 계산한다.
+    파일 전체를 메모리에 올리지 않도록 결과를 기다리는 묶음은 workers * 2개까지만 만든다.
+    """
+    chunks = iter_chunks(iter(lines), chunk_size)
+    if workers <= 1:
+        _init_worker(mode, precision)
+        for chunk in chunks:
+            yield from evaluate_lines(chunk)
+        return
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(mode, precision)) as executor:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(executor.submit(evaluate_lines, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='파일의 식을 한 줄씩 계산해서 결과를 한 줄씩 출력 (화면 없이 실행)')
+    parser.add_argument('input', help="식 파일 ('-'면 표준 입력)")
+    parser.add_argument('-o', '--output', help='결과 파일 (없으면 표준 출력)')
+    parser.add_argument('--mode', choices=('float', 'decimal', 'fraction'), default='float', help='계산 방식')
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION, help='decimal 방식의 유효 자릿수')
+    parser.add_argument('-j', '--workers', type=int, default=1, help='계산할 프로세스 수')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='프로세스에 한 번에 넘기는 줄 수')
+    parser.add_argument('--with-expression', action='store_true', help="'식<TAB>결과' 형식으로 출력")
+    args = parser.parse_args()
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error('--workers와 --chunk-size는 1 이상이어야 합니다.')
+
+    input_file = sys.stdin if args.input == '-' else open(args.input, 'r', encoding='utf-8')
+    output_file = sys.stdout if args.output is None else open(args.output, 'w', encoding='utf-8')
+    line_count = error_count = 0
+    start = time.perf_counter()
+    try:
+        # 식을 함께 출력할 때만 입력 줄을 한 번 더 순회하도록 복사
+        lines, expressions = itertools.tee(input_file) if args.with_expression else (input_file, None)
+        results = iter_results(lines, args.mode, args.precision, args.workers, args.chunk_size)
+        for result in results:
+            if expressions is not None:
+                output_file.write(next(expressions).strip() + '\t')
+            output_file.write(result + '\n')
+            line_count += 1
+            error_count += result in ERROR_RESULTS
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    seconds = time.perf_counter() - start
+    print(f'{line_count}줄 계산 ({error_count}개 오류) {seconds:.3f}s, '
+          f'{line_count / seconds if seconds else 0:,.0f} 줄/초', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
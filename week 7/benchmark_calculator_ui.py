@@ -0,0 +1,32 @@
+import os
+import sys
+
+from PyQt5.QtWidgets import QApplication, QPushButton
+
+from benchmark_expression import make_expression
+from calculator import Calculator
+
+REPEAT = 20  # 식을 처음부터 다시 입력하는 횟수 (명령행 인자로 변경 가능)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    # 화면 없이도 실행되도록 (이미 지정했으면 그대로)
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    app = QApplication(sys.argv[:1])
+    window = Calculator()
+    buttons = {button.text(): button for button in window.findChildren(QPushButton)}
+
+    expression = make_expression(30)
+    for _ in range(repeat):
+        for key in (*expression, '=', 'AC'):
+            buttons[key].click()
+
+    # 스타일시트는 글꼴 크기가 바뀔 때만(식 한 번에 36 -> 30 -> 24 -> 36) 적용되어야 함
+    print(f'{len(expression) + 2}개 키 입력 x {repeat}번')
+    print(window.stats.summary())
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import random
+import sys
+import time
+
+from expression import (
+    BINARY_OPERATORS, IncrementalEvaluator, calculate, compile_expression, format_number, tokenize
+)
+
+TERM_COUNTS = (10, 100, 1000)  # 식에 들어가는 숫자 개수
+REPEAT = 200  # 식마다 반복 계산 횟수 (명령행 인자로 변경 가능)
+
+# 화면이 멈추지 않도록 지켜야 하는 기준: 토큰 200개짜리 식을 1ms 안에 계산
+BUDGET_TOKENS = 200
+BUDGET_SECONDS = 0.001
+MODES = ('float', 'decimal', 'fraction')
+
+
+def make_expression(term_count, seed=0):
+    """계산기 버튼으로 만들 수 있는 긴 식 (숫자와 + - * /, 0으로 나누지 않음)"""
+    rng = random.Random(seed)
+    parts = [str(rng.randint(1, 999))]
+    for _ in range(term_count - 1):
+        parts.append(rng.choice('+-*/'))
+        parts.append(str(rng.randint(1, 999)) if rng.random() < 0.7 else f'{rng.uniform(1, 99):.2f}')
+    return ''.join(parts)
+
+
+def measure(func, expression, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(expression)
+    return (time.perf_counter() - start) / repeat
+
+
+def calculate_uncached(expression):
+    compile_expression.cache_clear()
+    return calculate(expression)
+
+
+def type_expression(expression, mode):
+    """식을 한 글자씩 IncrementalEvaluator에 입력하면서 매번 미리보기 계산"""
+    evaluator = IncrementalEvaluator(mode=mode)
+    for char in expression:
+        if char in BINARY_OPERATORS:
+            evaluator.input_operator(char)
+        else:
+            evaluator.input_digit(char)
+        evaluator.preview()
+    return evaluator.preview()
+
+
+def check_modes():
+    """decimal/fraction 방식의 결과와, 식을 비우거나(AC, 오류 뒤) 결과를 불러오는 경로 확인"""
+    assert format_number(calculate('0.1+0.2', mode='decimal')) == '0.3'
+    assert format_number(calculate('1/3*3', mode='fraction')) == '1'
+    for mode in MODES:
+        expression = make_expression(20)
+        assert type_expression(expression, mode) == calculate(expression, mode=mode)
+        evaluator = IncrementalEvaluator(mode=mode)
+        evaluator.load('')
+        evaluator.load(str(calculate('1/4', mode=mode)))
+        assert evaluator.preview() == calculate('1/4', mode=mode)
+
+
+def check_budget(repeat):
+    """계산 방식별로 토큰 200개짜리 식의 계산 시간이 기준 안인지 확인"""
+    expression = make_expression(BUDGET_TOKENS // 2 + 1)
+    token_count = len(tokenize(expression))
+    print(f'\n토큰 {token_count}개 식 계산 시간 (기준 {BUDGET_SECONDS * 1000:.0f}ms)')
+    all_passed = True
+    for mode in MODES:
+        def uncached(text):
+            compile_expression.cache_clear()
+            return calculate(text, mode=mode)
+
+        uncached_time = measure(uncached, expression, repeat)
+        cached_time = measure(lambda text: calculate(text, mode=mode), expression, repeat)
+        # 키 입력 하나당 시간 = 식 전체를 입력하는 시간 / 글자 수
+        key_time = measure(lambda text: type_expression(text, mode), expression, repeat) / len(expression)
+        passed = uncached_time < BUDGET_SECONDS
+        all_passed = all_passed and passed
+        print(f'{mode:<8}: 컴파일+계산 {uncached_time * 1e6:7.1f}us | 캐시 사용 {cached_time * 1e6:7.1f}us | '
+              f'키 입력당 미리보기 {key_time * 1e6:5.1f}us | {"통과" if passed else "초과"}')
+    return all_passed
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+    print('식 계산 시간 비교 (1회 평균)')
+    for term_count in TERM_COUNTS:
+        expression = make_expression(term_count)
+        assert calculate(expression) == eval(expression)
+
+        eval_time = measure(eval, expression, repeat)
+        uncached_time = measure(calculate_uncached, expression, repeat)
+        cached_time = measure(calculate, expression, repeat)
+        print(f'숫자 {term_count:>4}개: eval {eval_time * 1e6:9.1f}us | '
+              f'컴파일+계산 {uncached_time * 1e6:9.1f}us | '
+              f'캐시 사용 {cached_time * 1e6:9.1f}us ({eval_time / cached_time:.1f}x)')
+
+    check_modes()
+    if not check_budget(repeat):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
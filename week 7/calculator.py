@@ -1,16 +1,66 @@
-from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QGridLayout, QPushButton, QLineEdit
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QGridLayout, QPushButton, QLineEdit, QLabel
 from PyQt5.QtCore import Qt
+import argparse
 import sys
+import time
 
+from calculator_engine import CalculatorEngine
+from expression import DEFAULT_PRECISION
+
+DISPLAY_STYLE = (
+    'font-family: "Segoe UI", "Helvetica", "Arial", sans-serif; '
+    'font-size: {}px; height: 80px; color: white; '
+    'background-color: black; border: none;'
+)
+# (글자 수가 이보다 길면, 글꼴 크기) 순서로 확인하고 해당이 없으면 기본 크기
+FONT_SIZE_STEPS = ((12, 24), (8, 30))
+DEFAULT_FONT_SIZE = 36
+# 글꼴 크기별 스타일시트는 미리 한 번만 만들어 둠
+DISPLAY_STYLES = {
+    size: DISPLAY_STYLE.format(size)
+    for size in (DEFAULT_FONT_SIZE, *(size for _, size in FONT_SIZE_STEPS))
+}
+
+
+def font_size_for(length):
+    for limit, size in FONT_SIZE_STEPS:
+        if length > limit:
+            return size
+    return DEFAULT_FONT_SIZE
+
+
+class RenderStats:
+    """화면 갱신 비용 측정값 (스타일시트 재적용 횟수, 키 입력 한 번 처리 시간)"""
 
-class Calculator(QWidget):
     def __init__(self):
+        self.style_updates = 0
+        self.key_count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record_key(self, seconds):
+        self.key_count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def summary(self):
+        average = self.total_seconds / self.key_count if self.key_count else 0.0
+        return (f'키 입력 {self.key_count}번 | 평균 {average * 1e6:.1f}us | 최대 {self.max_seconds * 1e6:.1f}us | '
+                f'스타일시트 적용 {self.style_updates}번')
+
+
+class Calculator(QWidget):
+    """계산기 화면 (버튼 입력과 계산은 CalculatorEngine이 처리하고 결과 문자열만 보여 줌)"""
+
+    def __init__(self, mode='float', precision=DEFAULT_PRECISION):
         super().__init__()
         self.setWindowTitle('iPhone Style Calculator')
         self.setFixedSize(320, 500)
         self.setStyleSheet('background-color: black;')
-        self.expression = ''
-        self.last_input = ''
+        self.engine = CalculatorEngine(mode, precision)
+        self.stats = RenderStats()
+        self.font_size = None
         self.create_ui()
 
     def create_ui(self):
@@ -18,12 +68,18 @@ class Calculator(QWidget):
         self.display = QLineEdit()
         self.display.setReadOnly(True)
         self.display.setAlignment(Qt.AlignRight)
-        self.display.setStyleSheet(
+        self.update_font()
+        layout.addWidget(self.display)
+
+        # 입력 중인 식의 결과 미리보기
+        self.preview = QLabel()
+        self.preview.setAlignment(Qt.AlignRight)
+        self.preview.setFixedHeight(24)
+        self.preview.setStyleSheet(
             'font-family: "Segoe UI", "Helvetica", "Arial", sans-serif; '
-            'font-size: 36px; height: 80px; color: white; '
-            'background-color: black; border: none;'
+            'font-size: 18px; color: #a5a5a5; background-color: black;'
         )
-        layout.addWidget(self.display)
+        layout.addWidget(self.preview)
 
         grid = QGridLayout()
 
@@ -73,112 +129,38 @@ class Calculator(QWidget):
 
     def on_click(self):
         button = self.sender()
-        text = button.text()
-
-        if text == 'AC':
-            self.reset()
-        elif text == '+/-':
-            self.negative_positive()
-        elif text == '%':
-            self.percent()
-        elif text == '=':
-            self.equal()
-        else:
-            self.input_value(text)
-
-    def reset(self):
-        self.expression = ''
-        self.last_input = ''
-        self.display.setText('')
+        start = time.perf_counter()
+        if self.engine.press(button.text()):
+            self.refresh()
+        self.stats.record_key(time.perf_counter() - start)
+
+    def refresh(self):
+        self.display.setText(self.engine.display)
+        self.preview.setText(self.engine.preview_text())
         self.update_font()
 
-    def negative_positive(self):
-        try:
-            if self.expression:
-                if self.expression.startswith('-'):
-                    self.expression = self.expression[1:]
-                else:
-                    self.expression = '-' + self.expression
-                self.display.setText(self.expression)
-        except Exception:
-            self.display.setText('Error')
-            self.expression = ''
-        self.update_font()
-
-    def percent(self):
-        try:
-            if self.expression:
-                value = float(self.expression)
-                value /= 100
-                self.expression = str(value)
-                self.display.setText(self.format_result(value))
-        except Exception:
-            self.display.setText('Error')
-            self.expression = ''
-        self.update_font()
-
-    def input_value(self, value):
-        if value == '.' and '.' in self.expression.split()[-1]:
-            return
-        self.expression += value
-        self.display.setText(self.expression)
-        self.update_font()
-
-    def equal(self):
-        try:
-            result = eval(self.expression)
-            if isinstance(result, float):
-                result = round(result, 6)
-            self.display.setText(self.format_result(result))
-            self.expression = str(result)
-        except ZeroDivisionError:
-            self.display.setText('Divide by 0 Error')
-            self.expression = ''
-        except Exception:
-            self.display.setText('Error')
-            self.expression = ''
-        self.update_font()
-
-    def add(self, a, b):
-        return a + b
-
-    def subtract(self, a, b):
-        return a - b
-
-    def multiply(self, a, b):
-        return a * b
-
-    def divide(self, a, b):
-        if b == 0:
-            raise ZeroDivisionError
-        return a / b
-
-    def format_result(self, result):
-        result_str = str(result)
-        if '.' in result_str:
-            result_str = str(round(float(result), 6))
-            result_str = result_str.rstrip('0').rstrip('.') if '.' in result_str else result_str
-        return result_str
-
     def update_font(self):
-        text = self.display.text()
-        length = len(text)
-        if length > 12:
-            font_size = '24px'
-        elif length > 8:
-            font_size = '30px'
-        else:
-            font_size = '36px'
-
-        self.display.setStyleSheet(
-            f'font-family: "Segoe UI", "Helvetica", "Arial", sans-serif; '
-            f'font-size: {font_size}; height: 80px; color: white; '
-            f'background-color: black; border: none;'
-        )
+        font_size = font_size_for(len(self.display.text()))
+        # setStyleSheet은 CSS를 다시 해석하고 위젯을 다시 그리므로 크기가 바뀔 때만 적용
+        if font_size == self.font_size:
+            return
+        self.font_size = font_size
+        self.display.setStyleSheet(DISPLAY_STYLES[font_size])
+        self.stats.style_updates += 1
 
 
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    window = Calculator()
+    parser = argparse.ArgumentParser(description='iPhone 스타일 계산기')
+    parser.add_argument('--mode', choices=('float', 'decimal', 'fraction'), default='float',
+                        help='계산 방식 (decimal/fraction은 0.1 + 0.2 = 0.3처럼 오차 없이 계산)')
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION, help='decimal 방식의 유효 자릿수')
+    parser.add_argument('--stats', action='store_true', help='종료할 때 키 입력 처리 시간과 스타일시트 적용 횟수 출력')
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
+    window = Calculator(args.mode, args.precision)
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    if args.stats:
+        print(window.stats.summary())
+    sys.exit(exit_code)
@@ -0,0 +1,114 @@
+from expression import BINARY_OPERATORS, DEFAULT_PRECISION, IncrementalEvaluator, calculate, format_number
+
+BUTTON_KEYS = ('AC', '+/-', '%', '=', '.', *'0123456789', *BINARY_OPERATORS)
+
+
+class CalculatorEngine:
+    """계산기 버튼 입력과 화면에 보일 문자열을 관리하는 클래스 (PyQt5 없이 동작)
+
+    화면(Calculator 위젯)은 버튼이 눌리면 press()를 호출하고 display/preview_text()만 그대로 보여 주면 된다.
+    """
+
+    def __init__(self, mode='float', precision=DEFAULT_PRECISION):
+        # 식의 연산자별로 사용할 계산 메서드
+        self.operations = {'+': self.add, '-': self.subtract, '*': self.multiply, '/': self.divide}
+        # 계산 방식: 'float'(기존), 'decimal'(precision 자리 10진수), 'fraction'(분수, 오차 없음)
+        self.mode = mode
+        self.precision = precision
+        # 키 입력마다 상태를 갱신해서 미리보기 결과를 바로 계산
+        self.evaluator = IncrementalEvaluator(self.operations, mode, precision)
+        self.display = ''
+
+    @property
+    def expression(self):
+        return self.evaluator.expression
+
+    @expression.setter
+    def expression(self, text):
+        self.evaluator.load(text)
+
+    def press(self, key):
+        """버튼 하나 입력 (화면이 바뀌었으면 True 반환)"""
+        if key == 'AC':
+            self.reset()
+        elif key == '+/-':
+            self.negative_positive()
+        elif key == '%':
+            return self.percent()
+        elif key == '=':
+            self.equal()
+        elif key in BUTTON_KEYS:
+            return self.input_value(key)
+        else:
+            raise ValueError(f'알 수 없는 버튼입니다: {key}')
+        return True
+
+    def reset(self):
+        self.expression = ''
+        self.display = ''
+
+    def negative_positive(self):
+        # 식 전체가 아니라 입력 중인 숫자의 부호만 바꿈
+        if self.expression:
+            self.evaluator.negate()
+            self.display = self.expression
+
+    def percent(self):
+        # 입력 중인 숫자만 100으로 나눔
+        if not self.evaluator.percent():
+            return False
+        self.display = self.expression
+        return True
+
+    def input_value(self, value):
+        if value in BINARY_OPERATORS:
+            accepted = self.evaluator.input_operator(value)
+        else:
+            accepted = self.evaluator.input_digit(value)  # 한 숫자에 소수점 두 번은 무시
+        if accepted:
+            self.display = self.expression
+        return accepted
+
+    def preview_text(self):
+        # 연산자가 들어간 식일 때만 현재까지의 결과를 보여 줌 (O(1), 식 전체를 다시 계산하지 않음)
+        value = self.evaluator.preview() if self.evaluator.has_pending_operation else None
+        return '' if value is None else self.format_result(value)
+
+    def equal(self):
+        self.display, self.expression = self.evaluate(self.expression)
+
+    def evaluate(self, text):
+        """식 하나를 계산해서 (화면에 보일 결과, 이어서 입력할 식)을 반환 (입력 상태는 바꾸지 않음)"""
+        try:
+            # eval() 대신 식을 후위 표기로 컴파일(캐시)해서 사칙연산 메서드로 계산
+            result = calculate(text, self.operations, self.mode, self.precision)
+            if isinstance(result, float):
+                result = round(result, 6)
+            return self.format_result(result), str(result)
+        except ZeroDivisionError:
+            return 'Divide by 0 Error', ''
+        except Exception:
+            return 'Error', ''
+
+    def add(self, a, b):
+        return a + b
+
+    def subtract(self, a, b):
+        return a - b
+
+    def multiply(self, a, b):
+        return a * b
+
+    def divide(self, a, b):
+        if b == 0:
+            raise ZeroDivisionError
+        return a / b
+
+    def format_result(self, result):
+        if not isinstance(result, (int, float)):
+            return format_number(result)  # Decimal/Fraction은 반올림 없이 그대로
+        result_str = str(result)
+        if '.' in result_str:
+            result_str = str(round(float(result), 6))
+            result_str = result_str.rstrip('0').rstrip('.') if '.' in result_str else result_str
+        return result_str
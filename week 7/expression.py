@@ -0,0 +1,357 @@
+import decimal
+import operator
+import re
+from contextlib import nullcontext
+from fractions import Fraction
+from functools import lru_cache
+
+# 컴파일한 식을 보관할 개수 (같은 식을 다시 계산하면 파싱을 건너뜀)
+CACHE_SIZE = 256
+
+# 숫자(1, 1.5, .5, 5., 1e+16) 또는 연산자/괄호 하나
+TOKEN_PATTERN = re.compile(r'\s*(?:(\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)|(\S))')
+
+BINARY_OPERATORS = {'+': 1, '-': 1, '*': 2, '/': 2}  # 연산자: 우선순위
+UNARY_PRECEDENCE = 3
+NEGATE = 'neg'  # 단항 - 명령
+SYMBOLS = frozenset('+-*/()')
+
+
+class ExpressionError(ValueError):
+    """계산할 수 없는 식"""
+
+
+def divide(a, b):
+    if b == 0:
+        raise ZeroDivisionError
+    return a / b
+
+
+# 기본 사칙연산 (Calculator는 자신의 add/subtract/multiply/divide 메서드를 넘김)
+DEFAULT_OPERATIONS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': divide}
+
+
+def parse_number(text):
+    """숫자 문자열을 int 또는 float로 변환 (소수점이나 지수가 있으면 float)"""
+    if '.' in text or 'e' in text or 'E' in text:
+        return float(text)
+    return int(text)
+
+
+def parse_fraction(text):
+    """숫자 문자열을 Fraction으로 변환 (Fraction(문자열)의 정규식 파싱을 피해 정수로 바로 만듦)"""
+    if 'e' in text or 'E' in text or '/' in text:
+        return Fraction(text)
+    whole, _, decimals = text.partition('.')
+    return Fraction(int(whole + decimals), 10 ** len(decimals))
+
+
+# 계산 방식별 숫자 변환 함수
+# - float: 기존 방식 (빠르지만 0.1 + 0.2 = 0.30000000000000004 같은 오차가 있음)
+# - decimal: 10진수 그대로 계산 (precision 자리까지 정확)
+# - fraction: 분수로 계산 (1/3 * 3 = 1, 오차 없음)
+NUMBER_PARSERS = {'float': parse_number, 'decimal': decimal.Decimal, 'fraction': parse_fraction}
+DEFAULT_PRECISION = 28  # decimal 방식의 유효 자릿수
+
+
+def number_context(mode, precision=None):
+    """계산할 때 사용할 문맥 (decimal 방식이면 precision 자리의 decimal 문맥, 아니면 아무 일도 하지 않음)"""
+    if mode == 'decimal':
+        return decimal.localcontext(decimal.Context(prec=precision or DEFAULT_PRECISION))
+    return nullcontext()
+
+
+def tokenize(text, parse=parse_number):
+    """식을 숫자(parse로 변환)와 연산자/괄호 문자열의 리스트로 나눔"""
+    tokens = []
+    append = tokens.append
+    # 모든 글자가 숫자 또는 기호 하나에 걸리므로 findall 한 번으로 식 전체를 나눌 수 있음
+    for number, symbol in TOKEN_PATTERN.findall(text):
+        if number:
+            append(parse(number))
+        elif symbol in SYMBOLS:
+            append(symbol)
+        elif symbol:
+            raise ExpressionError(f'알 수 없는 문자입니다: {symbol}')
+    return tokens
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(text, mode='float'):
+    """식을 후위 표기 프로그램(숫자와 연산자 문자열의 튜플)으로 변환 (Shunting-yard, 결과는 캐시)
+
+    숫자는 mode(NUMBER_PARSERS)에 맞는 형식으로 미리 변환해 둔다.
+    예: '2+3*-4' -> (2, 3, -4, '*', '+'), '-(1+2)' -> (1, 2, '+', 'neg')
+    """
+    if mode not in NUMBER_PARSERS:
+        raise ValueError(f'알 수 없는 계산 방식입니다: {mode}')
+    program = []
+    operators = []  # (연산자, 우선순위)
+    expect_operand = True  # 다음에 숫자(또는 단항 연산자/여는 괄호)가 와야 하는지
+    depth = 0  # 실행했을 때 스택에 쌓일 값의 수 (식이 올바른지 확인용)
+
+    def emit(symbol):
+        nonlocal depth
+        if symbol == NEGATE and program and program[-1].__class__ is not str:
+            # 숫자 바로 앞의 단항 -는 미리 계산 (Decimal은 문맥 자릿수로 반올림하지 않도록 copy_negate)
+            number = program[-1]
+            program[-1] = number.copy_negate() if isinstance(number, decimal.Decimal) else -number
+            return
+        program.append(symbol)
+        if symbol != NEGATE:
+            depth -= 1
+
+    for token in tokenize(text, NUMBER_PARSERS[mode]):
+        if expect_operand:
+            # 숫자 토큰을 먼저 거름 (Fraction/Decimal과 문자열 비교는 느림)
+            if token.__class__ is not str:
+                program.append(token)
+                depth += 1
+                expect_operand = False
+            elif token == '(':
+                operators.append(('(', 0))
+            elif token == '-':
+                operators.append((NEGATE, UNARY_PRECEDENCE))
+            elif token == '+':
+                continue  # 단항 +는 아무 일도 하지 않음
+            else:
+                raise ExpressionError(f'숫자가 와야 할 자리에 {token}이(가) 있습니다.')
+        elif token.__class__ is not str:
+            raise ExpressionError(f'연산자가 와야 할 자리에 {token}이(가) 있습니다.')
+        elif token == ')':
+            while operators and operators[-1][0] != '(':
+                emit(operators.pop()[0])
+            if not operators:
+                raise ExpressionError('괄호 짝이 맞지 않습니다.')
+            operators.pop()
+        elif token in BINARY_OPERATORS:
+            precedence = BINARY_OPERATORS[token]
+            # 왼쪽 결합: 우선순위가 같거나 높은 연산자를 먼저 실행
+            while operators and operators[-1][1] >= precedence:
+                emit(operators.pop()[0])
+            operators.append((token, precedence))
+            expect_operand = True
+        else:
+            raise ExpressionError(f'연산자가 와야 할 자리에 {token}이(가) 있습니다.')
+
+    if expect_operand:
+        raise ExpressionError('식이 완성되지 않았습니다.')
+    while operators:
+        symbol = operators.pop()[0]
+        if symbol == '(':
+            raise ExpressionError('괄호 짝이 맞지 않습니다.')
+        emit(symbol)
+    if depth != 1:
+        raise ExpressionError('식이 올바르지 않습니다.')
+    return tuple(program)
+
+
+def evaluate(program, operations=None):
+    """후위 표기 프로그램을 스택으로 실행 (operations: 연산자별 계산 함수)"""
+    operations = DEFAULT_OPERATIONS if operations is None else operations
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for item in program:
+        if item.__class__ is str:
+            if item == NEGATE:
+                push(-pop())
+            else:
+                right = pop()
+                push(operations[item](pop(), right))
+        else:
+            push(item)
+    return stack[0]
+
+
+def calculate(text, operations=None, mode='float', precision=None):
+    """식 문자열을 계산 (컴파일 결과는 캐시에서 재사용)"""
+    program = compile_expression(text, mode)
+    with number_context(mode, precision):
+        return evaluate(program, operations)
+
+
+def format_number(value):
+    """계산 결과를 화면에 보여 줄 문자열로 변환 (Decimal은 지수 표기 없이, Fraction은 '분자/분모')"""
+    if isinstance(value, decimal.Decimal):
+        text = format(value, 'f')
+        return text.rstrip('0').rstrip('.') if '.' in text else text
+    if isinstance(value, Fraction):
+        return _format_fraction(value)
+    return str(value)
+
+
+def _format_fraction(value):
+    # 분모가 2와 5로만 이루어져 있으면 유한소수로 정확히 표현 (예: 3/10 -> 0.3), 아니면 '분자/분모'
+    denominator = value.denominator
+    twos = fives = 0
+    while denominator % 2 == 0:
+        denominator //= 2
+        twos += 1
+    while denominator % 5 == 0:
+        denominator //= 5
+        fives += 1
+    if denominator != 1:
+        return f'{value.numerator}/{value.denominator}'
+    digits = max(twos, fives)
+    text = str(abs(value.numerator) * 10 ** digits // value.denominator)
+    if digits:
+        text = text.rjust(digits + 1, '0')
+        text = f'{text[:-digits]}.{text[-digits:]}'
+    return '-' + text if value < 0 else text
+
+
+class IncrementalEvaluator:
+    """키를 누를 때마다 상태만 갱신해서 현재까지의 계산 결과를 O(1)로 알려 주는 클래스
+
+    + - * / 만 있는 식은 왼쪽부터 읽으면서 다음 값만 기억하면 된다.
+    - total, add_op: 끝난 덧셈/뺄셈 항들의 결과와 그 뒤의 + 또는 -
+    - term, term_op: 현재 항에서 끝난 곱셈/나눗셈 결과와 그 뒤의 * 또는 /
+    - operand: 입력 중인 숫자 (부호 포함 문자열)
+    식 전체를 다시 계산하지 않고 preview()로 결과를 바로 구할 수 있다.
+    """
+
+    def __init__(self, operations=None, mode='float', precision=None):
+        self.operations = DEFAULT_OPERATIONS if operations is None else operations
+        self.mode = mode
+        self.precision = precision
+        self._parse = NUMBER_PARSERS[mode]
+        self.reset()
+
+    def reset(self):
+        self.total = None
+        self.add_op = None
+        self.term = None
+        self.term_op = None
+        self.prefix = ''  # 입력 중인 숫자 앞까지의 식
+        self.operand = ''
+        self.failed = False  # 0으로 나누는 항이 있었으면 True
+        self._committed = None  # 마지막 연산자를 누르기 직전의 결과
+        self._before_operator = None  # 연산자를 바꿀 때 되돌릴 상태
+
+    def load(self, text):
+        """식(또는 = 결과)을 새로 불러옴 (빈 문자열이면 초기화)"""
+        self.reset()
+        try:
+            self._parse(text)
+            self.operand = text  # 숫자 하나('1e+16' 같은 지수 표기 포함)는 그대로 입력 중인 숫자로
+            return
+        except (ValueError, decimal.InvalidOperation):
+            pass
+        for char in text:
+            if char in BINARY_OPERATORS and self.operand not in ('', '-'):
+                self.input_operator(char)
+            else:
+                self.operand += char
+
+    @property
+    def expression(self):
+        return self.prefix + self.operand
+
+    @property
+    def has_pending_operation(self):
+        return bool(self.prefix)
+
+    def _operand_value(self):
+        try:
+            return self._parse(self.operand)
+        except (ValueError, decimal.InvalidOperation):
+            return None  # 아직 입력 중 ('', '-', '.')
+
+    def _fold(self, value):
+        # 현재 항에 value를 곱하거나 나눈 결과
+        if self.term is None:
+            return value
+        return self.operations[self.term_op](self.term, value)
+
+    def _combine(self, term_value):
+        if self.total is None:
+            return term_value
+        return self.operations[self.add_op](self.total, term_value)
+
+    def input_digit(self, char):
+        """숫자나 소수점 입력 (한 숫자에 소수점이 두 번 들어가면 무시하고 False 반환)"""
+        # '1/3'처럼 분수 결과를 불러온 숫자에는 소수점을 붙일 수 없음
+        if char == '.' and ('.' in self.operand or '/' in self.operand):
+            return False
+        self.operand += char
+        return True
+
+    def input_operator(self, symbol):
+        """연산자 입력 (숫자 없이 연산자를 연달아 누르면 마지막 연산자만 바꿈)"""
+        value = self._operand_value()
+        if value is None:
+            if not self.prefix and not self.operand and symbol == '-':
+                self.operand = '-'  # 맨 앞의 -는 음수 부호
+                return True
+            if self.operand or self._before_operator is None:
+                return False
+            # 직전 연산자를 누르기 전 상태로 되돌린 뒤 새 연산자로 다시 적용
+            *state, value = self._before_operator
+            self.total, self.add_op, self.term, self.term_op, self.failed = state
+            self.prefix = self.prefix[:-1]
+        else:
+            self._before_operator = (self.total, self.add_op, self.term, self.term_op, self.failed, value)
+            self.prefix += self.operand
+            self.operand = ''
+
+        self._apply(value, symbol)
+        self.prefix += symbol
+        return True
+
+    def _apply(self, value, symbol):
+        # 입력이 끝난 숫자를 현재 항에 반영하고, + 또는 -면 항을 끝냄
+        self._committed = None
+        if self.failed:
+            return
+        try:
+            with number_context(self.mode, self.precision):
+                self._apply_value(value, symbol)
+        except ZeroDivisionError:
+            self.failed = True
+
+    def _apply_value(self, value, symbol):
+        term = self._fold(value)
+        if symbol in ('+', '-'):
+            self.total = self._combine(term)
+            self.term = None
+            self.add_op = symbol
+        else:
+            self.term = term
+            self.term_op = symbol
+        self._committed = self._current_without_operand()
+
+    def _current_without_operand(self):
+        # 끝난 항들만으로 계산한 값 (연산자 직후 미리보기용)
+        if self.term is None:
+            return self.total
+        return self._combine(self.term)
+
+    def negate(self):
+        """입력 중인 숫자의 부호를 바꿈"""
+        if self.operand.startswith('-'):
+            self.operand = self.operand[1:]
+        else:
+            self.operand = '-' + self.operand
+
+    def percent(self):
+        """입력 중인 숫자를 100으로 나눔 (숫자가 없으면 False 반환)"""
+        value = self._operand_value()
+        if value is None:
+            return False
+        with number_context(self.mode, self.precision):
+            self.operand = format_number(self.operations['/'](value, self._parse('100')))
+        return True
+
+    def preview(self):
+        """지금까지 입력한 식의 결과 (계산할 수 없으면 None)"""
+        if self.failed:
+            return None
+        value = self._operand_value()
+        if value is None:
+            return self._committed
+        try:
+            with number_context(self.mode, self.precision):
+                return self._combine(self._fold(value))
+        except ZeroDivisionError:
+            return None
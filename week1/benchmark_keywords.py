@@ -0,0 +1,118 @@
+import random
+import string
+import time
+
+from keyword_matcher import KeywordMatcher
+
+LOG_FILE = 'mission_computer_main.log'
+LINE_COUNT = 20000  # 측정에 사용할 로그 줄 수
+KEYWORD_COUNTS = (10, 100, 1000)
+CATEGORY_COUNTS = (5, 50, 200)  # 분류 태깅 측정에 사용할 분류 수
+KEYWORDS_PER_CATEGORY = 5
+TAGGED_LINE_STEP = 10  # 이 줄 수마다 한 줄에 임의의 키워드를 넣어 분류가 여러 개 붙는 경우도 측정
+
+
+def load_sample_lines(file_path=LOG_FILE, line_count=LINE_COUNT):
+    """실제 로그를 반복해서 측정용 로그 줄 목록을 만드는 함수"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            lines = file.readlines()[1:]
+    except FileNotFoundError:
+        lines = ['2023-08-27 11:35:00,INFO,Oxygen tank unstable.\n']
+    return [lines[i % len(lines)] for i in range(line_count)]
+
+
+def make_keywords(count, seed=0):
+    """실제 키워드 두 개와 임의의 단어로 키워드 목록을 만드는 함수"""
+    rng = random.Random(seed)
+    keywords = ['unstable', 'explosion']
+    while len(keywords) < count:
+        keywords.append(''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10))))
+    return keywords[:count]
+
+
+def make_categories(category_count, keywords_per_category=KEYWORDS_PER_CATEGORY, seed=0):
+    """make_keywords()의 키워드를 분류마다 keywords_per_category개씩 나눈 {분류: 키워드 튜플}"""
+    keywords = make_keywords(category_count * keywords_per_category, seed)
+    return {
+        f'category{i}': tuple(keywords[i * keywords_per_category:(i + 1) * keywords_per_category])
+        for i in range(category_count)
+    }
+
+
+def add_keywords(lines, categories, step=TAGGED_LINE_STEP, seed=0):
+    """step줄마다 임의의 분류 키워드를 덧붙인 줄 목록 (여러 분류에 걸리는 줄을 만듦)"""
+    rng = random.Random(seed)
+    keywords = [keyword for group in categories.values() for keyword in group]
+    return [
+        line.rstrip('\n') + f' {rng.choice(keywords)} {rng.choice(keywords)}\n' if i % step == 0 else line
+        for i, line in enumerate(lines)
+    ]
+
+
+def per_category_loop(lines, categories):
+    """기존 방식: 줄마다 분류별로 키워드를 in 검사해서 일치하는 분류를 모음"""
+    results = []
+    for line in lines:
+        text = line.lower()
+        results.append(frozenset(
+            name for name, keywords in categories.items() if any(keyword in text for keyword in keywords)
+        ))
+    return results
+
+
+def matcher_tagging(lines, matcher):
+    """KeywordMatcher.match()로 한 번의 순회에 모든 분류를 찾음"""
+    return [matcher.match(line) for line in lines]
+
+
+def per_keyword_loop(lines, keywords):
+    """기존 방식: 키워드마다 소문자 변환 후 in 검사"""
+    return [line for line in lines if any(keyword in line.lower() for keyword in keywords)]
+
+
+def matcher_filter(lines, matcher):
+    """KeywordMatcher로 한 번에 검사"""
+    return [line for line in lines if matcher.matches(line)]
+
+
+def measure(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    lines = load_sample_lines()
+    print(f'로그 {len(lines)}줄 기준 문제 로그 필터링 시간 비교')
+    print(f'{"키워드 수":>8} | {"기존 루프(s)":>12} | {"매처(s)":>10} | {"배속":>6}')
+
+    for count in KEYWORD_COUNTS:
+        keywords = make_keywords(count)
+        matcher = KeywordMatcher({keyword: (keyword,) for keyword in keywords})
+
+        loop_time, loop_result = measure(per_keyword_loop, lines, keywords)
+        matcher_time, matcher_result = measure(matcher_filter, lines, matcher)
+
+        # 두 방식의 결과가 같은지 확인
+        assert loop_result == matcher_result
+        print(f'{count:>8} | {loop_time:>12.4f} | {matcher_time:>10.4f} | {loop_time / matcher_time:>5.1f}x')
+
+    print(f'\n로그 {len(lines)}줄 기준 분류 태깅 시간 비교 '
+          f'(분류당 키워드 {KEYWORDS_PER_CATEGORY}개, {TAGGED_LINE_STEP}줄마다 키워드 추가)')
+    print(f'{"분류 수":>8} | {"기존 루프(s)":>12} | {"match()(s)":>10} | {"배속":>6}')
+
+    for count in CATEGORY_COUNTS:
+        categories = make_categories(count)
+        tagged_lines = add_keywords(lines, categories)
+        matcher = KeywordMatcher(categories)
+
+        loop_time, loop_result = measure(per_category_loop, tagged_lines, categories)
+        matcher_time, matcher_result = measure(matcher_tagging, tagged_lines, matcher)
+
+        assert loop_result == matcher_result
+        print(f'{count:>8} | {loop_time:>12.4f} | {matcher_time:>10.4f} | {loop_time / matcher_time:>5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
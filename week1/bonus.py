@@ -1,26 +1,32 @@
-def process_logs():
+import argparse
+
+from keyword_matcher import KeywordMatcher, load_keyword_categories
+from log_shard import find_error_lines_parallel
+from log_stream import echo_lines, filter_error_lines, iter_log_lines_reversed
+
+
+def process_logs(workers=1):
     # 로그 파일 경로 설정
     log_file = 'mission_computer_main.log'  # 원본 로그 파일
     error_log_file = 'error_logs.txt'  # 문제 로그를 저장할 파일
 
     try:
-        # 로그 파일 읽기 (UTF-8 인코딩)
-        with open(log_file, 'r', encoding='utf-8') as file:
-            logs = file.readlines()  # 모든 로그를 리스트로 저장
-
-        # 첫 번째 줄(헤더) 제거
-        logs = logs[1:]
-
-        # 로그를 시간 역순으로 정렬 (최근 로그가 위로 오도록)
-        logs.reverse()
-
-        # 정렬된 로그를 콘솔에 출력
-        print('\n[전체 로그 목록 (시간 역순)]')
-        for line in logs:
-            print(line.strip())  # 각 로그의 앞뒤 공백 제거 후 출력
-
-        # 특정 키워드("unstable" 또는 "explosion")를 포함하는 문제 로그 필터링
-        error_logs = [line for line in logs if 'unstable' in line.lower() or 'explosion' in line.lower()]
+        # 설정된 키워드(기본값: "unstable", "explosion")로 문제 로그를 판단
+        categories = load_keyword_categories()
+
+        if workers > 1:
+            # 파일을 줄 경계에 맞춘 샤드로 나누어 여러 프로세스에서 동시에 검사
+            # 전체 로그 출력은 생략하고, 문제 로그는 직렬 처리와 같은 시간 역순으로 합침
+            print(f'\n[병렬 처리: 작업자 {workers}개, 전체 로그 출력 생략]')
+            error_logs = find_error_lines_parallel(log_file, workers, categories)
+        else:
+            # 파일 끝에서부터 블록 단위로 거꾸로 읽어 시간 역순으로 처리 (최근 로그가 위로 오도록)
+            # 헤더는 iter_log_lines_reversed()에서 건너뜀
+            print('\n[전체 로그 목록 (시간 역순)]')
+            logs = echo_lines(iter_log_lines_reversed(log_file))  # 각 로그를 출력하면서 다음 단계로 전달
+
+            # 문제 로그만 한 번의 순회로 필터링
+            error_logs = list(filter_error_lines(logs, KeywordMatcher(categories)))
 
         # 필터링된 문제 로그를 콘솔에 출력
         print('\n[*문제 로그 목록*]')
@@ -41,4 +47,7 @@ def process_logs():
 
 # 프로그램이 직접 실행될 경우 process_logs() 함수 호출
 if __name__ == '__main__':
-    process_logs()
+    parser = argparse.ArgumentParser(description='미션 컴퓨터 로그에서 문제 로그를 찾아 저장합니다.')
+    parser.add_argument('--workers', type=int, default=1, help='병렬로 검사할 작업자 프로세스 수 (기본값: 1)')
+    args = parser.parse_args()
+    process_logs(args.workers)
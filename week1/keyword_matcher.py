@@ -0,0 +1,111 @@
+import re
+from collections import deque
+
+# 키워드 설정 파일 (한 줄에 '분류=키워드1,키워드2' 형식)
+KEYWORD_FILE = 'error_keywords.txt'
+
+# 설정 파일이 없을 때 사용할 기본 분류 (분류 이름: 키워드 목록)
+DEFAULT_KEYWORD_CATEGORIES = {
+    'unstable': ('unstable',),
+    'explosion': ('explosion',)
+}
+
+
+def load_keyword_categories(file_path=KEYWORD_FILE):
+    """키워드 설정 파일을 읽어 {분류: 키워드 튜플} 딕셔너리로 반환하는 함수"""
+    categories = {}
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue  # 빈 줄, 주석, 형식이 틀린 줄은 무시
+                category, keywords = line.split('=', 1)
+                keywords = tuple(k.strip().lower() for k in keywords.split(',') if k.strip())
+                if keywords:
+                    categories[category.strip()] = keywords
+    except FileNotFoundError:
+        pass
+    return categories or dict(DEFAULT_KEYWORD_CATEGORIES)
+
+
+def _build_trie_pattern(node):
+    """트라이를 정규식으로 변환 (공통 접두사를 묶어서 키워드 수가 늘어도 분기가 적게 유지됨)"""
+    if '' in node:
+        return ''  # 여기서 끝나는 키워드가 있으면 더 긴 키워드는 확인할 필요가 없음
+    branches = [re.escape(char) + _build_trie_pattern(child) for char, child in sorted(node.items())]
+    if len(branches) == 1:
+        return branches[0]
+    return '(?:' + '|'.join(branches) + ')'
+
+
+class KeywordMatcher:
+    """여러 분류의 키워드를 하나의 Aho-Corasick 오토마톤으로 묶어 한 번의 순회로 검사하는 클래스"""
+
+    def __init__(self, categories=None):
+        if categories is None:
+            categories = DEFAULT_KEYWORD_CATEGORIES
+        self.categories = {name: tuple(k.lower() for k in keywords) for name, keywords in categories.items()}
+
+        # 전이 테이블: 상태마다 {문자: 다음 상태}, 출력: 상태에 도달하면 일치하는 분류 집합
+        self._delta = [{}]
+        self._output = [frozenset()]
+        trie = {}
+
+        for name, keywords in self.categories.items():
+            for keyword in keywords:
+                if not keyword:
+                    continue
+                state = 0
+                node = trie
+                for char in keyword:
+                    next_state = self._delta[state].get(char)
+                    if next_state is None:
+                        next_state = len(self._delta)
+                        self._delta[state][char] = next_state
+                        self._delta.append({})
+                        self._output.append(frozenset())
+                    state = next_state
+                    node = node.setdefault(char, {})
+                self._output[state] = self._output[state] | {name}
+                node[''] = True
+
+        self._build_failure_links()
+
+        # 키워드가 하나도 없는 줄을 빠르게 걸러내는 사전 필터 (트라이 기반 단일 정규식)
+        trie_pattern = _build_trie_pattern(trie)
+        self._prefilter = re.compile(trie_pattern) if trie_pattern else None
+
+    def _build_failure_links(self):
+        """실패 링크를 계산하고, 전이 테이블을 완성하여 검사 시 문자당 딕셔너리 조회 한 번으로 만듦"""
+        fail = [0] * len(self._delta)
+        queue = deque(self._delta[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._delta[state].items():
+                fail[next_state] = self._delta[fail[state]].get(char, 0)
+                self._output[next_state] = self._output[next_state] | self._output[fail[next_state]]
+                queue.append(next_state)
+            # 실패 상태의 전이를 물려받아 검사 중에 되돌아가는 루프를 없앰
+            self._delta[state] = {**self._delta[fail[state]], **self._delta[state]}
+
+    def match(self, line):
+        """줄에 포함된 모든 분류를 반환 (일치하는 분류가 없으면 빈 frozenset)"""
+        text = line.lower()
+        if self._prefilter is None or not self._prefilter.search(text):
+            return frozenset()
+
+        delta = self._delta
+        output = self._output
+        found = frozenset()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if output[state]:
+                found = found | output[state]
+        return found
+
+    def matches(self, line):
+        """문제 로그인지(키워드가 하나라도 포함되는지) 확인"""
+        return self._prefilter is not None and self._prefilter.search(line.lower()) is not None
@@ -0,0 +1,92 @@
+import json
+import os
+import time
+
+from log_stream import decode_line
+
+# 마지막으로 처리한 위치와 누적 집계를 저장하는 상태 파일
+STATE_FILE = 'log_analysis_state.json'
+
+
+def new_state(categories):
+    """처음부터 다시 집계할 때 사용할 빈 상태를 만드는 함수"""
+    return {
+        'inode': None,
+        'offset': 0,
+        'log_count': 0,
+        'category_counts': {category: 0 for category in categories}
+    }
+
+
+def load_state(state_file, categories):
+    """상태 파일을 읽어 반환 (파일이 없거나 키워드 분류가 바뀌었으면 새 상태)"""
+    try:
+        with open(state_file, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+    except (FileNotFoundError, ValueError):
+        return new_state(categories)
+
+    if list(state.get('category_counts', {})) != list(categories):
+        return new_state(categories)  # 분류가 바뀌면 기존 집계를 이어 쓸 수 없음
+    return state
+
+
+def save_state(state_file, state):
+    """상태 파일을 임시 파일에 쓴 뒤 교체하여, 중간에 중단되어도 깨지지 않게 저장"""
+    temp_file = state_file + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as file:
+        json.dump(state, file)
+    os.replace(temp_file, state_file)
+
+
+def process_new_lines(log_file, state, matcher, on_line=None):
+    """마지막 위치 이후에 추가된 완전한 줄만 읽어 집계를 갱신하고, 처리한 줄 수를 반환"""
+    stat = os.stat(log_file)
+
+    # 로그가 교체(다른 inode)되었거나 잘려서 작아졌으면 처음부터 다시 집계
+    if state['inode'] != stat.st_ino or stat.st_size < state['offset']:
+        state.update(new_state(state['category_counts']))
+        state['inode'] = stat.st_ino
+
+    if stat.st_size == state['offset']:
+        return 0
+
+    processed = 0
+    with open(log_file, 'rb') as file:
+        file.seek(state['offset'])
+        offset = state['offset']
+
+        for raw_line in file:
+            if not raw_line.endswith(b'\n'):
+                break  # 아직 쓰는 중인 마지막 줄은 다음에 처리
+
+            if offset == 0:
+                offset += len(raw_line)  # 첫 번째 줄(헤더) 건너뛰기
+                continue
+
+            offset += len(raw_line)
+            line = decode_line(raw_line)
+            state['log_count'] += 1
+            for category in matcher.match(line):
+                state['category_counts'][category] += 1
+            if on_line is not None:
+                on_line(line)
+            processed += 1
+
+        state['offset'] = offset
+
+    return processed
+
+
+def follow(log_file, state_file, matcher, on_update, interval=1.0, once=False):
+    """새 줄이 생길 때마다 집계를 갱신하고 on_update(state)를 호출 (once=True면 한 번만 실행)"""
+    state = load_state(state_file, matcher.categories)
+
+    while True:
+        processed = process_new_lines(log_file, state, matcher, lambda line: print(line.strip()))
+        if processed or once:
+            on_update(state)
+            save_state(state_file, state)
+        if once:
+            return state
+        time.sleep(interval)
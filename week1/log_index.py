@@ -0,0 +1,176 @@
+import argparse
+import os
+import struct
+from datetime import datetime
+
+from log_stream import decode_line
+
+LOG_FILE = 'mission_computer_main.log'
+INDEX_SUFFIX = '.idx'
+EVERY_N_LINES = 1000  # 몇 줄마다 인덱스 항목을 남길지
+
+# 인덱스 파일 구조: 헤더 + (타임스탬프 초, 바이트 오프셋) 고정 길이 항목 배열
+INDEX_MAGIC = b'MLIX'
+INDEX_VERSION = 1
+HEADER = struct.Struct('<4sHHIQQQ')  # 매직, 버전, 예약, 간격, inode, 인덱싱한 크기, 줄 수
+ENTRY = struct.Struct('<qQ')  # 타임스탬프(초), 줄 시작 바이트 오프셋
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+TIMESTAMP_LENGTH = 19
+EPOCH = datetime(1970, 1, 1)
+
+
+def parse_timestamp(text):
+    """'YYYY-MM-DD HH:MM:SS' 형식의 문자열을 정수 초로 변환 (형식이 다르면 None)"""
+    try:
+        return int((datetime.fromisoformat(text[:TIMESTAMP_LENGTH]) - EPOCH).total_seconds())
+    except ValueError:
+        return None
+
+
+def _line_timestamp(raw_line):
+    """바이트 한 줄의 앞부분에서 타임스탬프를 읽는 함수"""
+    return parse_timestamp(raw_line[:TIMESTAMP_LENGTH].decode('utf-8', 'replace'))
+
+
+def _read_header(file):
+    file.seek(0)
+    data = file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        return None
+    magic, version, _, every_n, inode, covered_size, line_count = HEADER.unpack(data)
+    if magic != INDEX_MAGIC or version != INDEX_VERSION:
+        return None
+    return {'every_n': every_n, 'inode': inode, 'covered_size': covered_size, 'line_count': line_count}
+
+
+def build_index(log_file=LOG_FILE, index_file=None, every_n=None):
+    """로그 파일의 희소 인덱스를 만들거나, 로그가 뒤에 추가되었으면 추가된 부분만 인덱싱하는 함수"""
+    index_file = index_file or log_file + INDEX_SUFFIX
+    stat = os.stat(log_file)
+
+    header = None
+    if os.path.exists(index_file):
+        with open(index_file, 'rb') as file:
+            header = _read_header(file)
+
+    # 간격을 지정하지 않으면 기존 인덱스의 간격을 그대로 사용
+    if every_n is None:
+        every_n = header['every_n'] if header else EVERY_N_LINES
+
+    # 로그가 교체되었거나 잘렸거나 간격이 바뀌었으면 처음부터 다시 만듦
+    if (header is None or header['inode'] != stat.st_ino or header['every_n'] != every_n
+            or header['covered_size'] > stat.st_size):
+        header = {'every_n': every_n, 'inode': stat.st_ino, 'covered_size': 0, 'line_count': 0}
+        with open(index_file, 'wb') as file:
+            file.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, 0, every_n, stat.st_ino, 0, 0))
+
+    if header['covered_size'] == stat.st_size:
+        return index_file
+
+    entries = bytearray()
+    offset = header['covered_size']
+    line_count = header['line_count']
+
+    with open(log_file, 'rb') as log:
+        log.seek(offset)
+        for raw_line in log:
+            if not raw_line.endswith(b'\n'):
+                break  # 아직 쓰는 중인 마지막 줄은 다음에 인덱싱
+
+            if offset > 0:  # 첫 번째 줄(헤더)은 인덱싱하지 않음
+                timestamp = _line_timestamp(raw_line)
+                if timestamp is not None:
+                    if line_count % every_n == 0:
+                        entries += ENTRY.pack(timestamp, offset)
+                    line_count += 1
+            offset += len(raw_line)
+
+    with open(index_file, 'r+b') as file:
+        file.seek(0, os.SEEK_END)
+        file.write(entries)
+        file.seek(0)
+        file.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, 0, every_n, stat.st_ino, offset, line_count))
+
+    return index_file
+
+
+def _find_start_offset(index_file, start_timestamp):
+    """인덱스를 이진 탐색하여 시작 시각 직전 항목의 바이트 오프셋을 찾는 함수"""
+    with open(index_file, 'rb') as file:
+        if _read_header(file) is None:
+            raise ValueError(f'{index_file} 은(는) 올바른 인덱스 파일이 아닙니다.')
+        file.seek(0, os.SEEK_END)
+        entry_count = (file.tell() - HEADER.size) // ENTRY.size
+
+        def entry(i):
+            file.seek(HEADER.size + i * ENTRY.size)
+            return ENTRY.unpack(file.read(ENTRY.size))
+
+        # 타임스탬프가 시작 시각보다 작은 마지막 항목 찾기
+        low, high = 0, entry_count
+        while low < high:
+            middle = (low + high) // 2
+            if entry(middle)[0] < start_timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return entry(low - 1)[1] if low > 0 else None
+
+
+def query_time_range(start, end, log_file=LOG_FILE, index_file=None):
+    """start~end(포함) 사이의 로그 줄만 읽어 돌려주는 제너레이터 (로그는 시간순으로 기록된다고 가정)"""
+    start_timestamp = parse_timestamp(start)
+    end_timestamp = parse_timestamp(end)
+    if start_timestamp is None or end_timestamp is None:
+        raise ValueError(f'시각은 {TIMESTAMP_FORMAT} 형식이어야 합니다.')
+
+    index_file = build_index(log_file, index_file)  # 로그가 늘어났으면 인덱스도 따라잡기
+    offset = _find_start_offset(index_file, start_timestamp)
+
+    with open(log_file, 'rb') as log:
+        if offset is None:
+            log.readline()  # 인덱스 첫 항목보다 이른 구간이면 헤더 다음부터 읽음
+        else:
+            log.seek(offset)
+
+        in_range = False
+        for raw_line in log:
+            timestamp = _line_timestamp(raw_line)
+            if timestamp is not None:
+                if timestamp > end_timestamp:
+                    break
+                in_range = timestamp >= start_timestamp
+            if in_range:
+                yield decode_line(raw_line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='미션 컴퓨터 로그의 타임스탬프 인덱스를 만들고 시간 구간을 조회합니다.')
+    parser.add_argument('--log', default=LOG_FILE, help='로그 파일 경로')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help='인덱스 만들기/갱신')
+    build_parser.add_argument('--every', type=int, default=EVERY_N_LINES, help='인덱스 항목 간격(줄 수)')
+
+    query_parser = subparsers.add_parser('query', help='시간 구간의 로그 조회')
+    query_parser.add_argument('start', help="시작 시각 (예: '2023-08-27 11:35:00')")
+    query_parser.add_argument('end', help="끝 시각 (예: '2023-08-27 11:40:00')")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            index_file = build_index(args.log, every_n=args.every)
+            print(f'인덱스가 {index_file} 에 저장되었습니다.')
+        else:
+            for line in query_time_range(args.start, args.end, args.log):
+                print(line.strip())
+    except FileNotFoundError:
+        print(f'Error: {args.log} 파일을 찾을 수 없습니다.')
+    except ValueError as e:
+        print(f'Error: {e}')
+
+
+if __name__ == '__main__':
+    main()
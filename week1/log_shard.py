@@ -0,0 +1,77 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from keyword_matcher import KeywordMatcher
+from log_stream import decode_line
+
+# 작업자가 샤드를 읽을 때 한 번에 읽어 올 블록 크기 (1MB)
+READ_SIZE = 1024 * 1024
+
+
+def compute_shards(file_path, shard_count):
+    """헤더를 제외한 파일을 줄 경계에 맞춘 (시작, 끝) 바이트 구간으로 나누는 함수"""
+    with open(file_path, 'rb') as file:
+        file.readline()  # 첫 번째 줄(헤더) 건너뛰기
+        data_start = file.tell()
+        file_size = os.fstat(file.fileno()).st_size
+
+        shard_size = max(1, (file_size - data_start) // max(1, shard_count))
+        boundaries = [data_start]
+        for i in range(1, shard_count):
+            position = data_start + i * shard_size
+            if position <= boundaries[-1]:
+                continue
+            if position >= file_size:
+                break
+            # 중간에서 잘린 줄은 앞 샤드에 포함시키고, 다음 줄 시작을 경계로 사용
+            file.seek(position - 1)
+            file.readline()
+            boundary = file.tell()
+            if boundaries[-1] < boundary < file_size:
+                boundaries.append(boundary)
+        boundaries.append(file_size)
+
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)]
+
+
+def iter_shard_lines(file_path, start, end, read_size=READ_SIZE):
+    """샤드 구간의 각 줄을 (바이트 오프셋, 문자열) 형태로 돌려주는 제너레이터"""
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        offset = start
+        position = start
+        carry = b''  # 블록 경계에 걸려 아직 완성되지 않은 줄
+
+        while position < end:
+            block = file.read(min(read_size, end - position))
+            if not block:
+                break
+            position += len(block)
+            lines = (carry + block).splitlines(keepends=True)
+            carry = lines.pop()  # 마지막 줄은 다음 블록과 이어질 수 있음
+            for raw_line in lines:
+                yield offset, decode_line(raw_line)
+                offset += len(raw_line)
+
+        if carry:
+            yield offset, decode_line(carry)
+
+
+def scan_shard(file_path, start, end, categories):
+    """작업자 프로세스에서 샤드 하나를 검사하여 문제 로그를 (오프셋, 줄) 목록으로 반환"""
+    matcher = KeywordMatcher(categories)
+    return [(offset, line) for offset, line in iter_shard_lines(file_path, start, end) if matcher.matches(line)]
+
+
+def find_error_lines_parallel(file_path, workers, categories):
+    """여러 프로세스로 샤드를 나눠 검사한 뒤, 문제 로그를 시간 역순으로 합쳐서 반환하는 함수"""
+    shards = compute_shards(file_path, workers)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(scan_shard, file_path, start, end, categories) for start, end in shards]
+        results = [future.result() for future in futures]
+
+    # 로그는 시간순으로 덧붙여지므로 바이트 오프셋 역순이 곧 시간 역순 (직렬 처리 결과와 동일한 순서)
+    merged = heapq.merge(*(reversed(result) for result in results), key=lambda item: item[0], reverse=True)
+    return [line for _, line in merged]
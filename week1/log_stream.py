@@ -0,0 +1,65 @@
+import os
+
+from keyword_matcher import KeywordMatcher
+
+# 역순 읽기 시 한 번에 읽어 올 블록 크기 (64KB)
+BLOCK_SIZE = 64 * 1024
+
+
+def iter_log_lines(file_path, skip_header=True):
+    """로그 파일을 앞에서부터 한 줄씩 돌려주는 제너레이터 (파일 전체를 메모리에 올리지 않음)"""
+    with open(file_path, 'r', encoding='utf-8') as file:
+        if skip_header:
+            file.readline()  # 첫 번째 줄(헤더) 건너뛰기
+        for line in file:
+            yield line
+
+
+def decode_line(raw_line):
+    """바이트 한 줄을 텍스트 모드와 같은 형태('\\n' 줄바꿈)의 문자열로 변환"""
+    text = raw_line.decode('utf-8')
+    stripped = text.rstrip('\r\n')
+    if len(stripped) != len(text):
+        return stripped + '\n'
+    return stripped
+
+
+def iter_log_lines_reversed(file_path, skip_header=True, block_size=BLOCK_SIZE):
+    """파일 끝에서부터 블록 단위로 거꾸로 읽어 한 줄씩 돌려주는 제너레이터 (시간 역순)"""
+    with open(file_path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        position = file.tell()
+        remainder = b''  # 블록 경계에 걸려 아직 완성되지 않은 줄
+
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            file.seek(position)
+            lines = (file.read(read_size) + remainder).splitlines(keepends=True)
+            if not lines:
+                continue
+
+            # 블록의 첫 줄은 앞쪽 블록과 이어질 수 있으므로 다음 차례로 미룸
+            remainder = lines[0]
+            for raw_line in reversed(lines[1:]):
+                yield decode_line(raw_line)
+
+        # 파일의 첫 번째 줄은 헤더이므로 필요할 때만 돌려줌
+        if remainder and not skip_header:
+            yield decode_line(remainder)
+
+
+def filter_error_lines(lines, matcher=None):
+    """문제 로그(키워드가 포함된 줄)만 골라서 돌려주는 제너레이터"""
+    if matcher is None:
+        matcher = KeywordMatcher()
+    for line in lines:
+        if matcher.matches(line):
+            yield line
+
+
+def echo_lines(lines):
+    """각 줄을 콘솔에 출력하면서 그대로 다음 단계로 넘기는 제너레이터"""
+    for line in lines:
+        print(line.strip())
+        yield line
@@ -1,4 +1,38 @@
-def main():
+import argparse
+
+from keyword_matcher import KeywordMatcher, load_keyword_categories
+from log_follow import STATE_FILE, follow
+from log_stream import iter_log_lines
+
+
+def write_report(report_file, log_count, category_counts):
+    """분석 결과를 Markdown 보고서 파일에 저장하는 함수"""
+    with open(report_file, 'w', encoding='utf-8') as file:
+        # 보고서 제목
+        file.write('# 로그 분석 보고서\n\n')
+
+        # 로그 개요 작성
+        file.write('## 1. 전체 로그 개요\n')
+        file.write(f'- 총 로그 개수: {log_count}개\n')  # 로그 개수 기록
+
+        # 분류별 문제 로그 개수 기록
+        file.write('- 분류별 문제 로그 개수:\n')
+        for category, count in category_counts.items():
+            file.write(f'  - {category}: {count}개\n')
+        file.write('\n')
+
+        # 사고 원인 분석 섹션 작성
+        file.write('## 2. 사고 원인 분석\n')
+        file.write('문제 로그를 보면, <11:35에 산소 탱크가 불안정해지고, 11:40에 폭발>한 것으로 보인다. ')
+        file.write('이는 시스템 이상이나 외부 충격이 원인일 가능성이 있다.\n')
+
+        # 결론 및 조치 사항 작성
+        file.write('\n## 3. 결론 및 조치\n')
+        file.write('- 산소 탱크 안전 점검 절차 강화\n')
+        file.write('- 미션 중 산소 탱크 센서 모니터링 시스템 추가\n')
+
+
+def main(incremental=False, follow_mode=False, interval=1.0):
     # 프로그램 시작 메시지 출력
     print('Hello Mars')
 
@@ -7,36 +41,36 @@ def main():
     report_file = 'log_analysis.md'  # 분석 결과를 저장할 Markdown 파일
 
     try:
-        # 로그 파일을 읽기 모드로 열기 (UTF-8 인코딩 사용)
-        with open(log_file, 'r', encoding='utf-8') as file:
-            logs = file.readlines()  # 모든 로그 데이터를 리스트로 저장
+        # 분류별 키워드를 하나의 매처로 묶어 한 줄당 한 번만 검사
+        matcher = KeywordMatcher(load_keyword_categories())
+        category_counts = {category: 0 for category in matcher.categories}
 
-        # 첫 번째 줄(헤더)을 제거하여 실제 로그 데이터만 남김
-        logs = logs[1:]
+        if incremental or follow_mode:
+            # 상태 파일에 저장된 위치 이후의 새 줄만 처리하고 누적 집계를 갱신
+            print('\n[새로 추가된 로그]')
+            follow(
+                log_file, STATE_FILE, matcher,
+                lambda state: write_report(report_file, state['log_count'], state['category_counts']),
+                interval=interval, once=not follow_mode
+            )
+            return
 
-        # 원본 로그를 콘솔에 출력 (로그 순서를 유지)
+        # 원본 로그를 한 줄씩 스트리밍으로 읽으며 콘솔에 출력 (로그 순서를 유지)
+        # 헤더는 iter_log_lines()에서 건너뛰므로 실제 로그 데이터만 남음
         print('\n[전체 로그 목록 (원본 순서)]')
-        for line in logs:
+        log_count = 0
+        for line in iter_log_lines(log_file):
             print(line.strip())  # 공백 제거 후 출력
+            log_count += 1
+            for category in matcher.match(line):
+                category_counts[category] += 1
 
         # 분석 결과를 Markdown 보고서 파일에 저장
-        with open(report_file, 'w', encoding='utf-8') as file:
-            # 보고서 제목
-            file.write('# 로그 분석 보고서\n\n')
-
-            # 로그 개요 작성
-            file.write('## 1. 전체 로그 개요\n')
-            file.write(f'- 총 로그 개수: {len(logs)}개\n\n')  # 로그 개수 기록
-
-            # 사고 원인 분석 섹션 작성
-            file.write('## 2. 사고 원인 분석\n')
-            file.write('문제 로그를 보면, <11:35에 산소 탱크가 불안정해지고, 11:40에 폭발>한 것으로 보인다. ')
-            file.write('이는 시스템 이상이나 외부 충격이 원인일 가능성이 있다.\n')
+        write_report(report_file, log_count, category_counts)
 
-            # 결론 및 조치 사항 작성
-            file.write('\n## 3. 결론 및 조치\n')
-            file.write('- 산소 탱크 안전 점검 절차 강화\n')
-            file.write('- 미션 중 산소 탱크 센서 모니터링 시스템 추가\n')
+    # Ctrl+C로 추적 모드 종료
+    except KeyboardInterrupt:
+        print('\n로그 추적을 종료합니다.')
 
     # 파일이 존재하지 않을 경우 예외 처리
     except FileNotFoundError:
@@ -48,4 +82,9 @@ def main():
 
 # 프로그램이 직접 실행될 때 main() 함수를 호출
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='미션 컴퓨터 로그를 분석하여 보고서를 작성합니다.')
+    parser.add_argument('--incremental', action='store_true', help='지난 실행 이후 추가된 로그만 처리')
+    parser.add_argument('--follow', action='store_true', help='tail -f처럼 새 로그를 계속 추적 (Ctrl+C로 종료)')
+    parser.add_argument('--interval', type=float, default=1.0, help='추적 모드에서 파일을 확인하는 간격(초)')
+    args = parser.parse_args()
+    main(args.incremental, args.follow, args.interval)
@@ -0,0 +1,52 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from main import save_binary_file, save_binary_file_bulk
+
+ROW_COUNT = 1000000  # 기본 측정 항목 수 (명령행 인자로 변경 가능)
+
+
+def make_inventory(row_count, seed=0):
+    """측정용 (물질 이름, 인화성 지수) 목록을 만드는 함수"""
+    rng = random.Random(seed)
+    return [(f'Substance {i}', round(rng.random(), 2)) for i in range(row_count)]
+
+
+def measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else ROW_COUNT
+    inventory = make_inventory(row_count)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        single_file = os.path.join(temp_dir, 'single.bin')
+        bulk_file = os.path.join(temp_dir, 'bulk.bin')
+        append_file = os.path.join(temp_dir, 'append.bin')
+
+        single_time = measure(save_binary_file, single_file, inventory)
+        bulk_time = measure(save_binary_file_bulk, bulk_file, inventory)
+
+        # 절반을 저장한 뒤 나머지를 이어 붙여도 같은 파일이 되는지 확인
+        half = row_count // 2
+        save_binary_file_bulk(append_file, inventory[:half])
+        append_time = measure(save_binary_file_bulk, append_file, inventory[half:], append=True)
+
+        with open(single_file, 'rb') as a, open(bulk_file, 'rb') as b, open(append_file, 'rb') as c:
+            single_bytes = a.read()
+            assert single_bytes == b.read() == c.read()
+
+    print(f'{row_count}개 항목 이진 파일 저장 시간 비교')
+    print(f'save_binary_file      : {single_time:.3f}s')
+    print(f'save_binary_file_bulk : {bulk_time:.3f}s ({single_time / bulk_time:.1f}x)')
+    print(f'append ({row_count - half}개 추가) : {append_time:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
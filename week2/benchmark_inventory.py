@@ -0,0 +1,87 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+from main import np, read_csv_columns, read_csv_file, sorted_indices, take_rows, threshold_indices
+
+ROW_COUNT = 1000000  # 기본 측정 행 수 (명령행 인자로 변경 가능)
+THRESHOLD = 0.7
+
+
+def make_inventory_csv(file_path, row_count, seed=0):
+    """측정용 인벤토리 CSV 파일을 만드는 함수"""
+    rng = random.Random(seed)
+    with open(file_path, 'w', encoding='utf-8') as file:
+        file.write('Substance,Weight (g/cm³),Specific Gravity,Strength,Flammability\n')
+        for i in range(row_count):
+            file.write(f'Substance {i},{rng.uniform(0.5, 3.0):.3f},Various,Various,{rng.random():.2f}\n')
+
+
+def run_tuple_version(file_path):
+    """기존 방식: 튜플 리스트 → 전체 정렬 → 리스트 컴프리헨션 필터"""
+    timings = {}
+    start = time.perf_counter()
+    inventory_list = read_csv_file(file_path)
+    timings['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sorted_inventory = sorted(inventory_list, key=lambda x: x[1], reverse=True)
+    timings['sort'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dangerous_items = [item for item in sorted_inventory if item[1] >= THRESHOLD]
+    timings['filter'] = time.perf_counter() - start
+    return timings, dangerous_items
+
+
+def run_columnar_version(file_path):
+    """열 단위 방식: 이름 테이블 + 실수 배열 → argsort → 벡터 임계값 필터"""
+    timings = {}
+    start = time.perf_counter()
+    names, flammability = read_csv_columns(file_path)
+    timings['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    order = sorted_indices(flammability)
+    timings['sort'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dangerous = threshold_indices(flammability, THRESHOLD, order)
+    timings['filter'] = time.perf_counter() - start
+
+    # 출력/저장을 위해 (이름, 인화성 지수) 튜플로 되돌리는 비용 (튜플 방식은 이미 튜플이므로 0)
+    start = time.perf_counter()
+    dangerous_items = take_rows(names, flammability, dangerous)
+    timings['rows'] = time.perf_counter() - start
+    return timings, dangerous_items
+
+
+def main():
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else ROW_COUNT
+    backend = 'numpy' if np is not None else "array('d')"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, 'inventory.csv')
+        make_inventory_csv(file_path, row_count)
+
+        tuple_timings, tuple_result = run_tuple_version(file_path)
+        columnar_timings, columnar_result = run_columnar_version(file_path)
+
+    # 두 방식의 결과(순서 포함)가 같은지 확인
+    assert tuple_result == columnar_result
+
+    print(f'{row_count}행 인벤토리 처리 시간 비교 (열 단위 백엔드: {backend})')
+    print(f'{"단계":>8} | {"튜플(s)":>10} | {"열 단위(s)":>10} | {"배속":>6}')
+    for step in ('load', 'sort', 'filter', 'rows'):
+        tuple_time = tuple_timings.get(step, 0.0)
+        print(f'{step:>8} | {tuple_time:>10.3f} | {columnar_timings[step]:>10.3f} | '
+              f'{tuple_time / columnar_timings[step]:>5.1f}x')
+    tuple_total = sum(tuple_timings.values())
+    columnar_total = sum(columnar_timings.values())
+    print(f'{"total":>8} | {tuple_total:>10.3f} | {columnar_total:>10.3f} | {tuple_total / columnar_total:>5.1f}x')
+
+
+if __name__ == '__main__':
+    main()
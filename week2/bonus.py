@@ -1,4 +1,5 @@
-from main import read_csv_file, save_binary_file  # main.py에서 함수 가져오기
+from main import read_csv_file, save_binary_file_bulk  # main.py에서 함수 가져오기
+from inventory_binary import InventoryBinaryFile, save_inventory_file
 import struct
 
 def read_binary_file(file_path):
@@ -26,6 +27,7 @@ def read_binary_file(file_path):
 def main():
     input_file = 'Mars_Base_Inventory_List.csv'  # 원본 CSV 파일
     binary_file = 'Mars_Base_Inventory_List.bin'  # 이진 파일 저장 위치
+    indexed_file = 'Mars_Base_Inventory_List.minv'  # 헤더/오프셋 표가 있는 새 형식 이진 파일
 
     # CSV 파일 읽기
     inventory_list = read_csv_file(input_file)
@@ -37,8 +39,8 @@ def main():
     # 인화성 기준으로 내림차순 정렬
     sorted_inventory = sorted(inventory_list, key=lambda x: x[1], reverse=True)
 
-    # 이진 파일 저장
-    save_binary_file(binary_file, sorted_inventory)
+    # 이진 파일 저장 (버퍼에 모아서 한 번에 기록)
+    save_binary_file_bulk(binary_file, sorted_inventory)
     print(f'\n정렬된 목록이 이진 파일 {binary_file}로 저장되었습니다.')
 
     # 저장된 이진 파일 읽기
@@ -49,5 +51,17 @@ def main():
     for item in loaded_data:
         print(f'{item[0]}: {item[1]}')
 
+    # 새 형식으로도 저장 (정렬된 순서가 헤더에 기록되어 이진 탐색 가능)
+    save_inventory_file(indexed_file, sorted_inventory)
+    with InventoryBinaryFile(indexed_file) as inventory:
+        print(f'\n< 새 형식 이진 파일 {indexed_file}: 항목 {len(inventory)}개 >')
+        print(f'첫 번째 항목: {inventory[0][0]}: {inventory[0][1]}')
+        print(f'마지막 항목: {inventory[-1][0]}: {inventory[-1][1]}')
+
+        # 파일 전체를 읽지 않고 이진 탐색으로 인화성 0.7 이상 항목만 조회
+        print('\n< 새 형식 이진 파일에서 찾은 인화성 0.7 이상 항목 >')
+        for name, flammability in inventory.items_at_least(0.7):
+            print(f'{name}: {flammability}')
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
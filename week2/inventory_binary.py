@@ -0,0 +1,187 @@
+import mmap
+import struct
+import sys
+import weakref
+from array import array
+
+# 파일 구조 (모든 값은 리틀 엔디언)
+#   헤더 (32바이트)        : 매직, 버전, 플래그, 항목 수, 문자열 힙 크기
+#                           플래그 FLAG_SORTED_DESC: 인화성 지수 내림차순으로 정렬되어 있음
+#   인화성 지수 열 (8 * n) : float64 배열
+#   이름 오프셋 표 (8 * (n+1)) : uint64 배열, 이름 i는 힙[offsets[i]:offsets[i+1]]
+#   문자열 힙             : UTF-8 이름을 이어 붙인 바이트
+MAGIC = b'MINV'
+VERSION = 1
+HEADER = struct.Struct('<4sHHQQ8x')
+FLOAT = struct.Struct('<d')
+OFFSET = struct.Struct('<Q')
+
+FLAG_SORTED_DESC = 0x0001
+
+
+def _little_endian(values):
+    """배열을 파일 형식(리틀 엔디언) 바이트로 변환"""
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def save_inventory_file(file_path, data, sort=False):
+    """(물질 이름, 인화성 지수) 목록을 헤더/오프셋 표/문자열 힙이 있는 이진 파일로 저장하는 함수
+
+    sort=True면 인화성 지수 내림차순으로 정렬해서 저장한다. 정렬 여부와 관계없이
+    저장하는 순서가 내림차순이면 헤더에 FLAG_SORTED_DESC를 기록한다.
+    """
+    if sort:
+        data = sorted(data, key=lambda x: x[1], reverse=True)
+
+    flammability = array('d')
+    offsets = array('Q', [0])
+    names = []
+    heap_size = 0
+    is_sorted = True
+
+    for name, value in data:
+        name_bytes = name.encode('utf-8')  # 길이 제한 없음 (255바이트 초과 가능)
+        names.append(name_bytes)
+        heap_size += len(name_bytes)
+        offsets.append(heap_size)
+        if flammability and value > flammability[-1]:
+            is_sorted = False
+        flammability.append(value)
+
+    flags = FLAG_SORTED_DESC if is_sorted else 0
+    with open(file_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, flags, len(flammability), heap_size))
+        file.write(_little_endian(flammability))
+        file.write(_little_endian(offsets))
+        file.write(b''.join(names))
+
+    return len(flammability)
+
+
+class InventoryBinaryFile:
+    """save_inventory_file()로 만든 파일을 mmap으로 열어, 복사 없이 i번째 항목에 바로 접근하는 클래스"""
+
+    def __init__(self, file_path):
+        self._file = open(file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # 빈 파일은 mmap 할 수 없음
+            self._file.close()
+            raise ValueError(f'올바른 인벤토리 파일이 아닙니다: {file_path}')
+
+        try:
+            magic, version, self.flags, self.count, heap_size = HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic, version = None, None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f'올바른 인벤토리 파일이 아닙니다: {file_path}')
+
+        self._flammability_start = HEADER.size
+        self._offsets_start = self._flammability_start + FLOAT.size * self.count
+        self._heap_start = self._offsets_start + OFFSET.size * (self.count + 1)
+        if self._heap_start + heap_size > len(self._mmap):
+            self.close()
+            raise ValueError(f'파일이 손상되었습니다: {file_path}')
+
+        # 각 구역을 가리키는 memoryview (데이터 복사 없음)
+        view = memoryview(self._mmap)
+        self._views = [view]
+        self._flammability_view = view[self._flammability_start:self._offsets_start]
+        self._heap_view = view[self._heap_start:self._heap_start + heap_size]
+        self._views += [self._flammability_view, self._heap_view]
+        self._exported = []  # 호출한 쪽에 넘긴 memoryview (weakref, 닫을 때 남아 있으면 해제)
+
+    def __len__(self):
+        return self.count
+
+    def _check_index(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError('인벤토리 항목 번호가 범위를 벗어났습니다.')
+        return i
+
+    def flammability(self, i):
+        """i번째 항목의 인화성 지수 (O(1))"""
+        i = self._check_index(i)
+        return FLOAT.unpack_from(self._mmap, self._flammability_start + FLOAT.size * i)[0]
+
+    def name(self, i):
+        """i번째 항목의 이름 (O(1), 오프셋 표로 문자열 힙에서 바로 잘라냄)"""
+        i = self._check_index(i)
+        start, end = struct.unpack_from('<2Q', self._mmap, self._offsets_start + OFFSET.size * i)
+        return str(self._heap_view[start:end], 'utf-8')
+
+    def __getitem__(self, i):
+        return self.name(i), self.flammability(i)
+
+    def iter_flammability(self):
+        """인화성 지수 열 전체를 순서대로 돌려주는 이터레이터 (struct.iter_unpack, 복사 없음)"""
+        return (value for (value,) in FLOAT.iter_unpack(self._flammability_view))
+
+    def __iter__(self):
+        for i, value in enumerate(self.iter_flammability()):
+            yield self.name(i), value
+
+    @property
+    def is_sorted(self):
+        """인화성 지수 내림차순으로 저장된 파일인지 여부"""
+        return bool(self.flags & FLAG_SORTED_DESC)
+
+    def count_at_least(self, threshold):
+        """인화성 지수가 threshold 이상인 항목 수 (정렬된 파일에서 이진 탐색, O(log n))"""
+        if not self.is_sorted:
+            raise ValueError('정렬되지 않은 파일에서는 이진 탐색을 할 수 없습니다.')
+
+        # 내림차순이므로 앞쪽 [0, low) 구간이 threshold 이상
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self.flammability(middle) >= threshold:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def flammability_at_least(self, threshold):
+        """threshold 이상인 인화성 지수 열 구간을 memoryview로 반환 (파일을 복사하지 않고 잘라냄)
+
+        반환된 memoryview는 파일을 닫을 때 함께 해제되므로, 닫은 뒤에는 사용할 수 없다.
+        """
+        view = self._flammability_view[:FLOAT.size * self.count_at_least(threshold)]
+        # 이미 사라진 view의 weakref는 정리
+        self._exported = [ref for ref in self._exported if ref() is not None]
+        self._exported.append(weakref.ref(view))
+        return view
+
+    def items_at_least(self, threshold):
+        """인화성 지수가 threshold 이상인 (이름, 인화성 지수)를 내림차순으로 돌려주는 제너레이터"""
+        for i in range(self.count_at_least(threshold)):
+            yield self[i]
+
+    def close(self):
+        # mmap을 닫기 전에 이를 참조하는 memoryview를 먼저 해제해야 함 (호출한 쪽에 넘긴 view 포함)
+        try:
+            for ref in getattr(self, '_exported', []):
+                view = ref()
+                if view is not None:
+                    view.release()
+            self._exported = []
+            for view in reversed(getattr(self, '_views', [])):
+                view.release()
+            self._views = []
+            if getattr(self, '_mmap', None) is not None:
+                self._mmap.close()
+                self._mmap = None
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,7 +1,23 @@
-def read_csv_file(file_path):
-    """CSV 파일을 읽고 인화성이 높은 물질을 리스트로 변환하는 함수"""
-    inventory_list = []  # 데이터를 저장할 리스트
+import argparse
+import heapq
+import itertools
+import struct
+from array import array
+
+try:
+    import numpy as np  # 있으면 벡터 연산으로 필터링/정렬
+except ImportError:
+    np = None  # 없으면 array 모듈로 대체
+
+# 이진 파일의 인화성 지수 형식 (8바이트 부동소수점, 한 번만 컴파일해서 재사용)
+FLOAT_STRUCT = struct.Struct('d')
 
+# 일괄 저장 시 버퍼에 모았다가 한 번에 쓰는 크기 (1MB)
+BULK_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_csv_file(file_path):
+    """CSV 파일을 한 줄씩 읽어 (물질 이름, 인화성 지수) 튜플을 돌려주는 제너레이터"""
     try:
         # UTF-8 인코딩으로 파일을 읽기 모드(r)로 열기
         with open(file_path, 'r', encoding='utf-8') as file:
@@ -15,27 +31,105 @@ def read_csv_file(file_path):
                 try:
                     name = parts[0].strip()  # 첫 번째 : 물질 이름
                     flammability = float(parts[4].strip())  # 다섯 번째 : 인화성 지수
-                    inventory_list.append((name, flammability))  # 리스트에 추가
                 except ValueError:
                     continue  # 숫자로 변환할 수 없는 경우 무시
+                yield name, flammability
     except FileNotFoundError:
         print(f'파일을 찾을 수 없습니다: {file_path}')
     except Exception as e:
         print(f'오류 발생: {e}')
-    
-    return inventory_list  # 최종적으로 (물질 이름, 인화성 지수) 리스트 반환
+
+
+def read_csv_file(file_path):
+    """CSV 파일을 읽고 인화성이 높은 물질을 리스트로 변환하는 함수"""
+    return list(iter_csv_file(file_path))  # 최종적으로 (물질 이름, 인화성 지수) 리스트 반환
+
+
+def read_csv_columns(file_path):
+    """CSV 파일을 열(column) 단위로 읽는 함수 (이름 목록, 인화성 지수 배열)
+
+    NumPy가 설치되어 있으면 인화성 지수를 numpy 배열로, 없으면 array('d')로 반환한다.
+    """
+    names = []  # 물질 이름 문자열 테이블
+    values = []  # 인화성 지수
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            file.readline()  # 첫 번째 줄(헤더) 건너뛰기
+
+            for line in file:
+                parts = line.split(',')
+                if len(parts) < 5:  # 잘못된 데이터는 무시
+                    continue
+                try:
+                    values.append(float(parts[4]))
+                except ValueError:
+                    continue  # 숫자로 변환할 수 없는 경우 무시
+                names.append(parts[0].strip())
+    except FileNotFoundError:
+        print(f'파일을 찾을 수 없습니다: {file_path}')
+    except Exception as e:
+        print(f'오류 발생: {e}')
+
+    if np is not None:
+        return names, np.array(values, dtype=np.float64)
+    return names, array('d', values)
+
+
+def sorted_indices(flammability):
+    """인화성 지수 내림차순 정렬 순서(argsort)를 반환 (같은 값은 원래 순서 유지)"""
+    if np is not None and isinstance(flammability, np.ndarray):
+        return np.argsort(-flammability, kind='stable')
+    return sorted(range(len(flammability)), key=flammability.__getitem__, reverse=True)
+
+
+def threshold_indices(flammability, threshold, order=None):
+    """인화성 지수가 threshold 이상인 행 번호를 반환 (order가 주어지면 그 순서를 유지)"""
+    if np is not None and isinstance(flammability, np.ndarray):
+        if order is None:
+            return np.flatnonzero(flammability >= threshold)
+        return order[flammability[order] >= threshold]
+    if order is None:
+        order = range(len(flammability))
+    return [i for i in order if flammability[i] >= threshold]
+
+
+def take_rows(names, flammability, indices):
+    """행 번호 순서대로 (물질 이름, 인화성 지수) 튜플 리스트를 만드는 함수"""
+    if np is not None and isinstance(flammability, np.ndarray):
+        indices = np.asarray(indices, dtype=np.intp)
+        return list(zip(map(names.__getitem__, indices.tolist()), flammability[indices].tolist()))
+    return [(names[i], flammability[i]) for i in indices]
+
+
+def top_k_items(items, k):
+    """인화성 지수가 가장 높은 k개를 내림차순으로 반환 (힙 사용, 전체 정렬 없이 O(n log k))"""
+    return heapq.nlargest(k, items, key=lambda x: x[1])
+
+
+def iter_threshold_items(items, threshold):
+    """인화성 지수가 threshold 이상인 항목만 돌려주는 제너레이터 (정렬하지 않고 바로 흘려보냄)"""
+    for item in items:
+        if item[1] >= threshold:
+            yield item
 
 
 def save_csv_file(file_path, data):
-    """리스트 데이터를 CSV 파일로 저장하는 함수"""
+    """리스트나 이터레이터의 데이터를 CSV 파일로 저장하는 함수 (저장한 행 수 반환)
+
+    제너레이터를 넘기면 전체 목록을 만들지 않고 한 행씩 바로 기록한다.
+    """
+    count = 0
     try:
         with open(file_path, 'w', encoding='utf-8') as file:
             file.write('Name,Flammability\n')  # 첫 번째 줄(헤더) 추가
 
             for item in data:
                 file.write(f'{item[0]},{item[1]}\n')  # 각 행을 CSV 형식으로 저장
+                count += 1
     except Exception as e:
         print(f'파일 저장 중 오류 발생: {e}')
+    return count
 
 
 def save_binary_file(file_path, data):
@@ -52,10 +146,89 @@ def save_binary_file(file_path, data):
         print(f'이진 파일 저장 중 오류 발생: {e}')
 
 
+def save_binary_file_bulk(file_path, data, append=False, chunk_size=BULK_CHUNK_SIZE):
+    """save_binary_file()과 같은 형식으로 저장하되, 항목들을 버퍼에 모아 큰 덩어리로 한 번에 쓰는 함수
+
+    append=True면 기존 파일 뒤에 이어서 저장한다 (헤더가 없는 형식이라 그대로 이어 붙일 수 있음).
+    실제로 파일에 쓴 항목 수를 반환한다. 중간에 오류가 나면 이번에 쓴 부분을 지워
+    저장 전 상태(append=True면 기존 내용 그대로)로 되돌리고 0을 반환한다.
+    """
+    record_packers = {}  # 이름 길이별로 컴파일한 레코드 형식 (길이 1바이트 + 이름 + 실수)
+    buffer = bytearray()
+    buffered_count = 0  # 버퍼에만 있고 아직 쓰지 않은 항목 수
+    count = 0
+
+    try:
+        with open(file_path, 'ab' if append else 'wb') as file:
+            start_size = file.tell()
+            try:
+                for item in data:
+                    name_bytes = item[0].encode('utf-8')
+                    name_length = len(name_bytes)
+                    pack = record_packers.get(name_length)
+                    if pack is None:
+                        if name_length > 255:
+                            raise ValueError(f'이름이 255바이트를 넘습니다: {item[0][:20]}...')
+                        pack = record_packers[name_length] = struct.Struct(f'=B{name_length}sd').pack
+
+                    buffer += pack(name_length, name_bytes, item[1])  # 레코드 하나를 한 번의 호출로 변환
+                    buffered_count += 1
+                    if len(buffer) >= chunk_size:
+                        file.write(buffer)
+                        buffer.clear()
+                        count += buffered_count
+                        buffered_count = 0
+
+                if buffer:
+                    file.write(buffer)
+                    count += buffered_count
+            except Exception:
+                # 일부만 저장된 파일이 남지 않도록 이번에 쓴 덩어리를 지움
+                count = 0
+                file.truncate(start_size)
+                raise
+    except Exception as e:
+        print(f'이진 파일 저장 중 오류 발생: {e}')
+    return count
+
+
 def float_to_bytes(value):
     """실수를 바이트로 변환"""
-    import struct
-    return struct.pack('d', value)  # 8바이트(64비트) 부동소수점 형식으로 변환
+    return FLOAT_STRUCT.pack(value)  # 8바이트(64비트) 부동소수점 형식으로 변환
+
+
+def run_query(input_file, output_file, threshold=None, top_k=None):
+    """전체 정렬 없이 임계값/상위 k개 조건으로 위험 물질을 골라 저장하는 함수
+
+    threshold가 None이면 임계값으로 거르지 않고, 둘 다 주면 임계값 이상인 항목 중 상위 k개를 고른다.
+    """
+    items = iter_csv_file(input_file)
+    # 출력 파일을 열기('w') 전에 입력을 확인 (입력이 없을 때 기존 결과 파일을 지우지 않도록)
+    first_item = next(items, None)
+    if first_item is None:
+        print('파일에서 데이터를 읽어오지 못했습니다.')
+        return
+    items = itertools.chain([first_item], items)
+    if threshold is not None:
+        items = iter_threshold_items(items, threshold)
+
+    if top_k is None:
+        # 정렬 없이 파일 순서대로 바로 기록 (메모리에 목록을 만들지 않음)
+        count = save_csv_file(output_file, items)
+    else:
+        # 상위 k개만 힙으로 유지
+        top_items = top_k_items(items, top_k)
+        print(f'인화성 상위 {top_k}개 항목 목록:')
+        for item in top_items:
+            print(f'{item[0]}: {item[1]}')
+        count = save_csv_file(output_file, top_items)
+
+    conditions = []
+    if threshold is not None:
+        conditions.append(f'인화성 {threshold} 이상')
+    if top_k is not None:
+        conditions.append(f'상위 {top_k}개')
+    print(f'\n{" 중 ".join(conditions)} 항목 {count}개가 {output_file} 에 저장되었습니다.')
 
 
 def main():
@@ -91,7 +264,19 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='화성 기지 인벤토리에서 인화성이 높은 물질을 찾습니다.')
+    parser.add_argument('--top', type=int,
+                        help='인화성 상위 K개만 힙으로 골라 저장 (전체 정렬 없음, --threshold와 함께 주면 그 이상인 항목 중에서 고름)')
+    parser.add_argument('--threshold', type=float, help='이 값 이상인 항목만 정렬 없이 바로 저장')
+    args = parser.parse_args()
+
+    if args.top is None and args.threshold is None:
+        main()
+    else:
+        run_query('Mars_Base_Inventory_List.csv', 'Mars_Base_Inventory_danger.csv', args.threshold, args.top)
 
 # 외부에서 import 가능하도록 설정
-__all__ = ['read_csv_file', 'save_binary_file']
+__all__ = [
+    'iter_csv_file', 'read_csv_file', 'read_csv_columns', 'sorted_indices', 'threshold_indices', 'take_rows',
+    'top_k_items', 'iter_threshold_items', 'save_csv_file', 'save_binary_file', 'save_binary_file_bulk'
+]